@@ -0,0 +1,74 @@
+from random import random
+from timeit import timeit
+
+from tensor import TensorType
+from matrix import Matrix
+from vector import Vector
+
+
+def benchmark(label, generic, bulk, number):
+    generic_time = timeit(generic, number=number)
+    bulk_time = timeit(bulk, number=number)
+    print(
+        "%-32s %10.3f ms %10.3f ms %8.1fx" % (
+            label,
+            generic_time * 1000,
+            bulk_time * 1000,
+            generic_time / bulk_time
+        )
+    )
+
+
+def dot_benchmarks(storage, size=32, number=10000):
+    matrix = Matrix([random() for i in range(16)], storage=storage)
+    vector = Vector([random() for i in range(4)], storage=storage)
+    benchmark(
+        "4x4 . 4x1 (%s)" % storage,
+        lambda: TensorType.dot_elements(matrix, vector),
+        lambda: matrix.dot_elements(vector),
+        number
+    )
+    benchmark(
+        "4x4 transform (%s)" % storage,
+        lambda: vector.set_elements(
+            TensorType.dot_elements(matrix, vector)
+        ),
+        lambda: matrix.transform(vector),
+        number
+    )
+
+    matrix = Matrix(
+        [random() for i in range(size**2)], storage=storage
+    )
+    other = matrix.copy()
+    benchmark(
+        "%ix%i . %ix%i (%s)" % (size, size, size, size, storage),
+        lambda: TensorType.dot_elements(matrix, other),
+        lambda: matrix.dot_elements(other),
+        number // 1000
+    )
+
+
+def elementwise_benchmarks(storage, size=32, number=1000):
+    matrix = Matrix(
+        [random() for i in range(size**2)], storage=storage
+    )
+    other = matrix.copy()
+    benchmark(
+        "%ix%i iadd (%s)" % (size, size, storage),
+        lambda: TensorType.iadd(matrix, other),
+        lambda: matrix.iadd(other),
+        number
+    )
+    benchmark(
+        "%ix%i iscale (%s)" % (size, size, storage),
+        lambda: TensorType.iscale(matrix, 1.0),
+        lambda: matrix.iscale(1.0),
+        number
+    )
+
+
+print("%-32s %13s %13s %9s" % ("", "generic", "bulk", "speedup"))
+for storage in ("list", "array"):
+    dot_benchmarks(storage)
+    elementwise_benchmarks(storage)
@@ -1,24 +1,169 @@
+from array import array
 from collections.abc import Iterable, Sized
+from itertools import repeat
+from operator import add, mul, sub
 
-from tensor import Tensor, TensorType
+from tensor import Tensor, TensorReference, TensorType
 from vector import Vector
 
 
-class Matrix(Tensor):
-    @classmethod
-    def _determinant_recursion(cls, tensor):
-        if tensor.width < 3:
-            a, b, c, d = tensor._elements
-            return a * d - b * c
-        else:
-            determinant = 0
-            for i in range(tensor.width):
-                determinant += tensor._elements[i] \
-                    * cls._determinant_recursion(
-                        tensor.cofactor(i, 0)
-                    ) * (-1)**i
-            return determinant
+class LUDecomposition:
+    def __init__(self, matrix):
+        self._matrix = matrix
+        self._dimension = dimension = matrix.dimension
+        self._elements = elements = list(matrix.elements)
+        self._permutation = list(range(dimension))
+        self._parity = 1
+        self._singular = False
+
+        for k in range(dimension):
+            pivot = max(
+                range(k, dimension), 
+                key=lambda i: abs(elements[i * dimension + k])
+            )
+            if elements[pivot * dimension + k] == 0:
+                self._singular = True
+                continue
+            if pivot != k:
+                self.swap_rows(k, pivot)
+            diagonal = elements[k * dimension + k]
+            upper = elements[k * dimension + k + 1 : (k + 1) * dimension]
+            for i in range(k + 1, dimension):
+                factor = elements[i * dimension + k] / diagonal
+                elements[i * dimension + k] = factor
+                if factor != 0:
+                    elements[i * dimension + k + 1 : (i + 1) * dimension] = \
+                        map(
+                            sub, 
+                            elements[i * dimension + k + 1 : (i + 1) * dimension], 
+                            map(mul, upper, repeat(factor))
+                        )
 
+    @property
+    def matrix(self): return self._matrix
+    @property
+    def dimension(self): return self._dimension
+    @property
+    def permutation(self): return tuple(self._permutation)
+    @property
+    def singular(self): return self._singular
+    @property
+    def lower(self):
+        dimension = self._dimension
+        return Matrix.new_tensor(
+            dimension,
+            elements=[
+                v if i % dimension < i // dimension 
+                else 1 if i % dimension == i // dimension 
+                else 0
+                for i, v in enumerate(self._elements)
+            ]
+        )
+    @property
+    def upper(self):
+        dimension = self._dimension
+        return Matrix.new_tensor(
+            dimension,
+            elements=[
+                v if i % dimension >= i // dimension else 0
+                for i, v in enumerate(self._elements)
+            ]
+        )
+    @property
+    def determinant(self):
+        if self._singular:
+            return 0
+        determinant = self._parity
+        for i in range(self._dimension):
+            determinant *= self._elements[i * self._dimension + i]
+        return determinant
+    det = determinant
+    @property
+    def inverse(self):
+        return self.solve_many(
+            Matrix.identity(self._dimension).to_storage(self._matrix.storage)
+        )
+    @property
+    def adjoint(self):
+        if not self._singular:
+            return self.inverse.iscale(self.determinant)
+        dimension = self._dimension
+        matrix = Matrix(list(self._matrix.elements))
+        right, left = matrix.null_space, Matrix(
+            [j for i in matrix.column_buffers() for j in i]
+        ).null_space
+        adjoint = Matrix.empty(dimension).to_storage(self._matrix.storage)
+        if right.width != 1 or left.width != 1:
+            return adjoint
+        right, left = list(right.elements), list(left.elements)
+        row, column = max(
+            ((i, j) for i in range(dimension) for j in range(dimension)), 
+            key=lambda i: abs(right[i[0]] * left[i[1]])
+        )
+        scale = matrix.cofactor(row, column).determinant \
+            * (-1)**(row + column) / (right[row] * left[column])
+        return adjoint.set_elements(
+            [scale * i * j for i in right for j in left]
+        )
+
+    def swap_rows(self, row, other):
+        dimension = self._dimension
+        elements = self._elements
+        elements[row * dimension : (row + 1) * dimension], \
+            elements[other * dimension : (other + 1) * dimension] = \
+            elements[other * dimension : (other + 1) * dimension], \
+            elements[row * dimension : (row + 1) * dimension]
+        self._permutation[row], self._permutation[other] = \
+            self._permutation[other], self._permutation[row]
+        self._parity = -self._parity
+        return self
+
+    def substitute(self, rows):
+        if self._singular:
+            raise ZeroDivisionError("Matrix is singular")
+        dimension = self._dimension
+        elements = self._elements
+        rows = [rows[i] for i in self._permutation]
+        for i in range(dimension):
+            row = rows[i]
+            for j in range(i):
+                factor = elements[i * dimension + j]
+                row = list(
+                    map(sub, row, map(mul, rows[j], repeat(factor)))
+                ) if factor != 0 else row
+            rows[i] = row
+        for i in reversed(range(dimension)):
+            row = rows[i]
+            for j in range(i + 1, dimension):
+                factor = elements[i * dimension + j]
+                row = list(
+                    map(sub, row, map(mul, rows[j], repeat(factor)))
+                ) if factor != 0 else row
+            diagonal = elements[i * dimension + i]
+            rows[i] = [v / diagonal for v in row]
+        return rows
+
+    def solve(self, resultant):
+        resultant = resultant if isinstance(resultant, Tensor) \
+            else Vector(resultant)
+        return self.solve_many(resultant)
+    def solve_many(self, resultants):
+        resultants = resultants if isinstance(resultants, Tensor) \
+            else Tensor.from_columns(resultants)
+        elements = []
+        [
+            elements.extend(i) 
+            for i in self.substitute(resultants.row_buffers())
+        ]
+        return resultants.new_tensor(
+            resultants.width, 
+            height=resultants.height, 
+            elements=elements, 
+            storage=resultants.storage
+        )
+
+
+class Matrix(Tensor):
     @classmethod
     def new_tensor(cls, width, height=None, elements=None, **kwargs):
         return cls(
@@ -58,14 +203,181 @@ class Matrix(Tensor):
 
     @property
     def dimension(self): return self.width
+    @property
+    def transpose(self):
+        return MatrixReference(
+            self, 0, 0, self.height, self.width, strides=(self.width, 1)
+        )
         
+    @property
+    def lu(self): return self.cached("lu", lambda: LUDecomposition(self))
     @property
     def determinant(self): 
-        return self._determinant_recursion(self)
+        return self.cached("determinant", lambda: self.lu.determinant)
     det = determinant
     @property
     def inverse(self):
-        return self.adjoint / self.determinant
+        return self.cached("inverse", lambda: self.lu.inverse)
+    @property
+    def adjoint(self): return self.lu.adjoint
+
+    def solve(self, resultant): return self.lu.solve(resultant)
+    def solve_many(self, resultants): return self.lu.solve_many(resultants)
 
 
-    
\ No newline at end of file
+class MatrixReference(TensorReference):
+    dimension = Matrix.dimension
+    lu, determinant, det, inverse, adjoint = Matrix.lu, Matrix.determinant, \
+        Matrix.det, Matrix.inverse, Matrix.adjoint
+    solve, solve_many = Matrix.solve, Matrix.solve_many
+
+    def cached(self, key, generate):
+        return self._tensor.cached(
+            (key, self._offset, self._strides, tuple(self._shape)), generate
+        )
+
+
+class TridiagonalMatrix(TensorType):
+    @classmethod
+    def from_bands(cls, lower, diagonal, upper, cyclic=False):
+        return cls(lower, diagonal, upper, cyclic=cyclic)
+    @classmethod
+    def fill(cls, dimension, lower, diagonal, upper, cyclic=False):
+        return cls(
+            [lower] * dimension, 
+            [diagonal] * dimension, 
+            [upper] * dimension, 
+            cyclic=cyclic
+        )
+
+    def __init__(self, lower, diagonal, upper, cyclic=False):
+        self._diagonal = array("d", diagonal)
+        dimension = len(self._diagonal)
+        self._lower, self._upper = (
+            (array("d", i) + array("d", [0] * dimension))[:dimension]
+            for i in (lower, upper)
+        )
+        self._cyclic = bool(cyclic)
+        if not self._cyclic and dimension:
+            self._lower[0] = self._upper[-1] = 0
+        super().__init__(dimension, dimension)
+
+    @property
+    def dimension(self): return self.width
+    @property
+    def cyclic(self): return self._cyclic
+    @property
+    def lower(self): return self._lower
+    @property
+    def diagonal(self): return self._diagonal
+    @property
+    def upper(self): return self._upper
+
+    def band_address(self, index):
+        column, row = self.address(index)
+        offset = (column - row) % self.dimension
+        return self._diagonal if offset == 0 \
+            else self._upper if offset == 1 and (row < self.dimension - 1 
+                                                 or self._cyclic) \
+            else self._lower if offset == self.dimension - 1 \
+                and (row > 0 or self._cyclic) \
+            else None, row
+
+    def get_index(self, index):
+        band, row = self.band_address(index)
+        return 0 if band is None else band[row]
+    def set_index(self, index, element):
+        band, row = self.band_address(index)
+        if band is None:
+            if element != 0:
+                raise IndexError("Element is outside of the matrix band")
+        else:
+            band[row] = element
+        return self
+
+    def dot(self, other): return Tensor.dot(self, other)
+    def copy(self):
+        return self.new(
+            self._lower, self._diagonal, self._upper, cyclic=self._cyclic
+        )
+    def to_matrix(self, **kwargs):
+        return Matrix.new_tensor(
+            self.dimension, elements=self.elements, **kwargs
+        )
+
+    def substitute(self, rows):
+        dimension = self.dimension
+        lower, diagonal, upper = self._lower, self._diagonal, self._upper
+        factors = [0] * dimension
+        rows = list(rows)
+        for i in range(dimension):
+            pivot = diagonal[i] - (lower[i] * factors[i - 1] if i > 0 else 0)
+            if pivot == 0:
+                raise ZeroDivisionError("Matrix is singular")
+            factors[i] = upper[i] / pivot
+            row = rows[i] if i == 0 else map(
+                sub, rows[i], map(mul, rows[i - 1], repeat(lower[i]))
+            )
+            rows[i] = [v / pivot for v in row]
+        for i in reversed(range(dimension - 1)):
+            rows[i] = list(
+                map(sub, rows[i], map(mul, rows[i + 1], repeat(factors[i])))
+            )
+        return rows
+    def dense_substitute(self, rows):
+        dimension = self.dimension
+        elements = [0] * dimension**2
+        for i in range(dimension):
+            elements[i * dimension + i] += self._diagonal[i]
+            elements[i * dimension + (i + 1) % dimension] += self._upper[i]
+            elements[i * dimension + (i - 1) % dimension] += self._lower[i]
+        return Matrix(elements).lu.substitute(list(rows))
+    def cyclic_substitute(self, rows):
+        dimension = self.dimension
+        gamma = -self._diagonal[0]
+        alpha, beta = self._upper[-1], self._lower[0]
+        diagonal = self._diagonal[:]
+        diagonal[0] -= gamma
+        diagonal[-1] -= alpha * beta / gamma
+        reduced = self.new(self._lower, diagonal, self._upper)
+        rows = reduced.substitute(
+            [
+                list(v) + [
+                    gamma if i == 0 else alpha if i == dimension - 1 else 0
+                ]
+                for i, v in enumerate(rows)
+            ]
+        )
+        correction = [
+            v / (1 + rows[0][-1] + beta / gamma * rows[-1][-1]) 
+            for v in map(
+                add, rows[0][:-1], map(mul, rows[-1][:-1], repeat(beta / gamma))
+            )
+        ]
+        return [
+            list(
+                map(sub, v[:-1], map(mul, correction, repeat(v[-1])))
+            )
+            for v in rows
+        ]
+
+    def solve(self, resultant):
+        resultant = resultant if isinstance(resultant, Tensor) \
+            else Vector(resultant)
+        return self.solve_many(resultant)
+    def solve_many(self, resultants):
+        resultants = resultants if isinstance(resultants, Tensor) \
+            else Tensor.from_columns(resultants)
+        rows = resultants.row_buffers()
+        rows = self.cyclic_substitute(rows) if self._cyclic \
+                and self.dimension > 2 \
+            else self.dense_substitute(rows) if self._cyclic \
+            else self.substitute(rows)
+        elements = []
+        [elements.extend(i) for i in rows]
+        return resultants.new_tensor(
+            resultants.width, 
+            height=resultants.height, 
+            elements=elements, 
+            storage=resultants.storage
+        )
@@ -0,0 +1,77 @@
+from random import Random
+
+from pytest import raises
+
+from matrix import Matrix, TridiagonalMatrix
+from tensor import Tensor
+from vector import Vector
+
+
+def close(values, expected, tolerance=1e-12):
+    values = list(values)
+    return len(values) == len(expected) and all(
+        abs(i - j) <= tolerance for i, j in zip(values, expected)
+    )
+
+
+def test_lu_determinant_and_solve():
+    matrix = Matrix([2, 1, 1, 1, 3, 2, 1, 0, 0])
+    assert abs(matrix.determinant + 1) < 1e-12
+    assert Matrix([0, 1, 1, 0]).determinant == -1
+    solution = matrix.solve(Vector(4, 5, 6))
+    assert isinstance(solution, Vector)
+    assert close(solution.elements, [6, 15, -23], 1e-9)
+    lu = matrix.lu
+    rows = matrix.row_buffers()
+    assert close(
+        (lu.lower * lu.upper).elements, 
+        [j for i in lu.permutation for j in rows[i]]
+    )
+
+
+def test_lu_inverse_and_singular_matrices():
+    random = Random(1)
+    matrix = Matrix([random.uniform(-1, 1) for i in range(25)])
+    assert close(
+        (matrix * matrix.inverse).elements, 
+        list(Matrix.identity(5).elements), 1e-9
+    )
+    singular = Matrix([1, 2, 2, 4])
+    assert singular.determinant == 0 and singular.lu.singular
+    with raises(ZeroDivisionError):
+        singular.inverse
+
+
+def band_matrix(lower, diagonal, upper, cyclic):
+    dimension = len(diagonal)
+    elements = [0] * dimension**2
+    for i in range(dimension):
+        elements[i * dimension + i] += diagonal[i]
+        if cyclic or i < dimension - 1:
+            elements[i * dimension + (i + 1) % dimension] += upper[i]
+        if cyclic or i > 0:
+            elements[i * dimension + (i - 1) % dimension] += lower[i]
+    return Matrix(elements)
+
+
+def test_tridiagonal_solvers_match_dense_lu():
+    random = Random(0)
+    for dimension in range(1, 9):
+        for cyclic in (False, True):
+            bands = [
+                [random.uniform(-1, 1) for i in range(dimension)], 
+                [random.uniform(4, 5) for i in range(dimension)], 
+                [random.uniform(-1, 1) for i in range(dimension)]
+            ]
+            resultants = Tensor(
+                2, height=dimension, 
+                elements=[random.random() for i in range(2 * dimension)]
+            )
+            solution = TridiagonalMatrix(*bands, cyclic=cyclic).solve_many(
+                resultants
+            )
+            expected = band_matrix(*bands, cyclic).solve_many(resultants)
+            assert all(
+                abs(i - j) < 1e-12 
+                for i, j in zip(solution.elements, expected.elements)
+            )
@@ -83,6 +83,9 @@ class TkinterGraphComponent(ABC):
     def move_element(self, element, *coordinates):
         self._canvas.coords(element, *coordinates)
         return self
+    def delete_element(self, element):
+        self._canvas.delete(element)
+        return self
 
     def update(self):
         self.update_visible()
@@ -130,6 +133,8 @@ class SingleElementTkinterGraphComponent(TkinterGraphComponent):
         self._canvas.tag_lower(self._element, component, *args, **kwargs)
         return self
 
+    def delete(self): return self.delete_element(self._element)
+
     def update_color(self):
         return self.reconfigure_element(self._element, fill=self._color)
     def update_visible(self):
@@ -661,7 +666,15 @@ class TkinterInterpolationCurve(TkinterGraphComponent):
         )
         return self
 
+    def remove_surplus(self):
+        [i.delete() for i in self._curve_points[self.curve_points:]]
+        [i.delete() for i in self._curve_segments[self.curve_segments:]]
+        del self._curve_points[self.curve_points:]
+        del self._curve_segments[self.curve_segments:]
+        return self
+
     def update_points(self):
+        self.remove_surplus()
         [
             self.add_curve_point(0)
             for i in range(
@@ -675,6 +688,7 @@ class TkinterInterpolationCurve(TkinterGraphComponent):
         ]
         
     def update_segments(self):
+        self.remove_surplus()
         [
             self.add_curve_segment(i)
             for i in range(
@@ -718,6 +732,51 @@ class TkinterInterpolationCurve(TkinterGraphComponent):
         return self
 
 
+class TkinterTessellatedCurve(TkinterInterpolationCurve):
+    def __init__(self, canvas, origin, visible, function, tolerance, 
+                    point_color, segment_color, point_diameter, scale=1):
+        self._tolerance = tolerance
+        self._scale = scale
+        self._tessellation = function.tessellate(tolerance / scale)
+        super().__init__(
+            canvas, origin, visible, function, 1, 
+            point_color, segment_color, point_diameter
+        )
+
+    @property
+    def tessellation(self): return self._tessellation
+    @property
+    def tolerance(self): return self._tolerance
+    @tolerance.setter
+    def tolerance(self, tolerance): self.set_tolerance(tolerance)
+    @property
+    def scale(self): return self._scale
+    @scale.setter
+    def scale(self, scale): self.set_scale(scale)
+    @property
+    def lower_function_bound(self): return 0
+    @property
+    def upper_function_bound(self): return self.curve_points
+    @property
+    def curve_points(self): return self._tessellation.height
+
+    def set_tolerance(self, tolerance):
+        self._tolerance = tolerance
+        return self.retessellate()
+    def set_scale(self, scale):
+        self._scale = scale
+        return self.retessellate()
+    def retessellate(self):
+        self._tessellation = self._function.tessellate(
+            self._tolerance / self._scale
+        )
+        return self.update_resolution()
+
+    def function_output(self, index):
+        horizontal, vertical = self._tessellation.row(index)[:2]
+        return horizontal * self._scale, -vertical * self._scale
+
+
 class TkinterCanvasDragHandler:
     def __init__(self):
         self._dragging = False
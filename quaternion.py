@@ -0,0 +1,270 @@
+from array import array
+from collections.abc import Sequence
+from math import acos, cos, sin, exp
+
+from tensor import Tensor, TensorType
+from vector import Vector
+from transform import Transform
+
+
+class Quaternion(Vector):
+    @staticmethod
+    def multiply_elements(a, b):
+        aw, ax, ay, az = a
+        bw, bx, by, bz = b
+        return (
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw
+        )
+    @staticmethod
+    def conjugate_elements(a):
+        return a[0], -a[1], -a[2], -a[3]
+    @staticmethod
+    def normalize_elements(a):
+        magnitude = sum(i**2 for i in a)**0.5
+        return tuple(i / magnitude for i in a)
+    @staticmethod
+    def log_elements(a):
+        w, x, y, z = a
+        magnitude = (x**2 + y**2 + z**2)**0.5
+        angle = acos(min(max(w, -1), 1))
+        scale = angle / magnitude if magnitude > 1e-12 else 1
+        return 0, x * scale, y * scale, z * scale
+    @staticmethod
+    def exp_elements(a):
+        w, x, y, z = a
+        angle = (x**2 + y**2 + z**2)**0.5
+        scale = sin(angle) / angle if angle > 1e-12 else 1
+        magnitude = exp(w)
+        return (
+            magnitude * cos(angle),
+            magnitude * x * scale,
+            magnitude * y * scale,
+            magnitude * z * scale
+        )
+    @staticmethod
+    def slerp_weights(a, b):
+        cosine = min(
+            max(sum(i * j for i, j in zip(a, b)), -1), 1
+        )
+        angle = acos(cosine)
+        return angle, sin(angle)
+    @classmethod
+    def slerp_elements(cls, a, b, t, weights=None):
+        angle, sine = cls.slerp_weights(a, b) if weights is None else weights
+        if sine < 1e-9:
+            return cls.normalize_elements(
+                [i + (j - i) * t for i, j in zip(a, b)]
+            )
+        leading = sin((1 - t) * angle) / sine
+        trailing = sin(t * angle) / sine
+        return tuple(
+            i * leading + j * trailing for i, j in zip(a, b)
+        )
+    @classmethod
+    def squad_elements(cls, a, b, s, r, t):
+        return cls.slerp_elements(
+            cls.slerp_elements(a, b, t),
+            cls.slerp_elements(s, r, t),
+            2 * t * (1 - t)
+        )
+
+    @classmethod
+    def identity(cls): return cls(1, 0, 0, 0)
+    @classmethod
+    def from_axis_angle(cls, theta, axis):
+        axis = list(axis.elements if isinstance(axis, TensorType) else axis)
+        magnitude = sum(i**2 for i in axis)**0.5
+        scale = sin(theta / 2) / magnitude
+        return cls(cos(theta / 2), *(i * scale for i in axis))
+
+    def __init__(self, *elements, dimension=None, **kwargs):
+        super().__init__(*elements, dimension=4, **kwargs)
+
+    @property
+    def w(self): return self._elements[0]
+    @property
+    def x(self): return self._elements[1]
+    @property
+    def y(self): return self._elements[2]
+    @property
+    def z(self): return self._elements[3]
+    @property
+    def conjugate(self):
+        return self.new(self.conjugate_elements(self._elements))
+    @property
+    def inverse(self):
+        return self.conjugate / sum(i**2 for i in self._elements)
+    @property
+    def rotation_elements(self):
+        return Transform.quaternion_elements(*self._elements)
+    @property
+    def matrix(self): return Transform.quaternion(*self._elements)
+
+    def multiply(self, other):
+        return self.new(
+            self.multiply_elements(self._elements, other._elements)
+        )
+    def rotate(self, point):
+        point = point.elements if isinstance(point, TensorType) else point
+        return self.multiply_elements(
+            self.multiply_elements(self._elements, (0, *point)),
+            self.conjugate_elements(self._elements)
+        )[1:]
+    def slerp(self, other, t):
+        other = other._elements if self.dot(other) >= 0 else [
+            -i for i in other._elements
+        ]
+        return self.new(
+            self.slerp_elements(self._elements, other, t)
+        )
+
+    def __mul__(self, other):
+        return self.multiply(other) if isinstance(other, Quaternion) \
+            else super().__mul__(other)
+
+
+class OrientationTrack:
+    def __init__(self, keys=None, interpolation="squad"):
+        self._keys = []
+        self._controls = None
+        self._interpolation = interpolation
+        self.set_keys(() if keys is None else keys)
+
+    @property
+    def keys(self):
+        return tuple(
+            Quaternion(i) for i in self._keys
+        )
+    @property
+    def size(self): return len(self._keys)
+    @property
+    def segments(self): return max(self.size - 1, 0)
+    @property
+    def interpolation(self): return self._interpolation
+    @property
+    def controls(self):
+        if self._controls is None:
+            keys = self._keys
+            self._controls = [
+                Quaternion.multiply_elements(
+                    v,
+                    Quaternion.exp_elements(
+                        tuple(
+                            -(j + k) / 4 for j, k in zip(
+                                Quaternion.log_elements(
+                                    Quaternion.multiply_elements(
+                                        Quaternion.conjugate_elements(v),
+                                        keys[i + 1]
+                                    )
+                                ),
+                                Quaternion.log_elements(
+                                    Quaternion.multiply_elements(
+                                        Quaternion.conjugate_elements(v),
+                                        keys[i - 1]
+                                    )
+                                )
+                            )
+                        )
+                    )
+                ) if 0 < i < len(keys) - 1 else v
+                for i, v in enumerate(keys)
+            ]
+        return self._controls
+
+    def key_elements(self, key):
+        return Quaternion.normalize_elements(
+            tuple(key.elements if isinstance(key, TensorType) else key)
+        )
+    def align(self, index):
+        if index > 0 and sum(
+            i * j for i, j in zip(self._keys[index - 1], self._keys[index])
+        ) < 0:
+            self._keys[index] = tuple(-i for i in self._keys[index])
+        return self
+    def set_keys(self, keys):
+        self._keys = [self.key_elements(i) for i in keys]
+        [self.align(i) for i in range(self.size)]
+        self._controls = None
+        return self
+    def set_key(self, index, key):
+        index %= self.size
+        self._keys[index] = self.key_elements(key)
+        [self.align(i) for i in range(index, self.size)]
+        self._controls = None
+        return self
+    def add_key(self, key, index=-1):
+        index = min(
+            index if index >= 0 else max(self.size + index, 0), self.size
+        )
+        self._keys.insert(index, self.key_elements(key))
+        [self.align(i) for i in range(index, self.size)]
+        self._controls = None
+        return self
+    def remove_key(self, index):
+        index %= self.size
+        self._keys.pop(index)
+        [self.align(i) for i in range(index, self.size)]
+        self._controls = None
+        return self
+
+    def segment_index(self, t):
+        return min(max(int(t // 1), 0), self.segments - 1)
+    def segment_output(self, index, t):
+        keys = self._keys
+        return Quaternion.slerp_elements(keys[index], keys[index + 1], t) \
+            if self._interpolation == "slerp" \
+            else Quaternion.squad_elements(
+                keys[index], keys[index + 1],
+                self.controls[index], self.controls[index + 1],
+                t
+            )
+    def output(self, t):
+        index = self.segment_index(t)
+        return Quaternion(
+            self.segment_output(index, t - index)
+        )
+
+    def segment_buckets(self, ts):
+        last = self.segments - 1
+        buckets = {}
+        [
+            buckets.setdefault(
+                min(max(int(t // 1), 0), last), []
+            ).append(i)
+            for i, t in enumerate(ts)
+        ]
+        return buckets.items()
+    def evaluate_many(self, ts, buckets=None):
+        ts = ts if isinstance(ts, Sequence) else list(ts)
+        buckets = self.segment_buckets(ts) if buckets is None else buckets
+        keys = self._keys
+        squad = self._interpolation != "slerp"
+        controls = self.controls if squad else None
+        outputs = array("d", bytes(32 * len(ts)))
+        for index, positions in buckets:
+            leading, trailing = keys[index], keys[index + 1]
+            weights = Quaternion.slerp_weights(leading, trailing)
+            if squad:
+                inner = controls[index], controls[index + 1]
+                inner_weights = Quaternion.slerp_weights(*inner)
+            for position in positions:
+                t = ts[position] - index
+                output = Quaternion.slerp_elements(
+                    leading, trailing, t, weights=weights
+                )
+                output = Quaternion.slerp_elements(
+                    output,
+                    Quaternion.slerp_elements(
+                        *inner, t, weights=inner_weights
+                    ),
+                    2 * t * (1 - t)
+                ) if squad else output
+                outputs[position * 4 : position * 4 + 4] = array("d", output)
+        return Tensor(4, height=len(ts), elements=outputs, link=True)
+
+    def __len__(self): return self.size
+    def __getitem__(self, index): return Quaternion(self._keys[index])
+    def __setitem__(self, index, key): self.set_key(index, key)
@@ -0,0 +1,46 @@
+from math import pi
+
+from quaternion import OrientationTrack, Quaternion
+
+
+def close(values, expected, tolerance=1e-12):
+    values = list(values)
+    return len(values) == len(expected) and all(
+        abs(i - j) <= tolerance for i, j in zip(values, expected)
+    )
+
+
+def test_slerp():
+    leading = Quaternion.identity()
+    trailing = Quaternion.from_axis_angle(pi / 2, (0, 0, 2))
+    assert close(trailing.rotate((1, 0, 0)), [0, 1, 0])
+    assert close(leading.slerp(trailing, 0).elements, [1, 0, 0, 0])
+    assert close(
+        leading.slerp(trailing, 1).elements, list(trailing.elements)
+    )
+    assert close(
+        leading.slerp(trailing, 0.5).elements,
+        list(Quaternion.from_axis_angle(pi / 4, (0, 0, 1)).elements)
+    )
+    assert close(
+        leading.slerp(-trailing, 0.5).elements,
+        list(leading.slerp(trailing, 0.5).elements)
+    )
+
+
+def test_orientation_track():
+    keys = [Quaternion.from_axis_angle(i * 0.8, (1, i, 2)) for i in range(5)]
+    keys[2] = -keys[2]
+    for interpolation in ("squad", "slerp"):
+        track = OrientationTrack(keys, interpolation=interpolation)
+        assert all(
+            i.dot(j) >= 0 for i, j in zip(track.keys[:-1], track.keys[1:])
+        )
+        for i, key in enumerate(track.keys):
+            assert close(track.output(i).elements, list(key.elements))
+        ts = [0.3, 3.7, 1.2, 2.5]
+        outputs = track.evaluate_many(ts)
+        assert (outputs.width, outputs.height) == (4, len(ts))
+        for t, output in zip(ts, outputs.row_buffers()):
+            assert close(output, list(track.output(t).elements))
+            assert abs(sum(i**2 for i in output) - 1) <= 1e-12
@@ -0,0 +1,648 @@
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable
+from itertools import product
+from math import ceil, dist, floor
+from operator import mul
+
+from tensor import Tensor, TensorType
+from spline import InterpolationCurve
+
+
+class CurveSegmentIndex(ABC):
+    def __init__(self, source):
+        self._source = source
+        self._coefficients = None
+
+    @abstractmethod
+    def build(): raise NotImplementedError
+    @abstractmethod
+    def update_segment(): raise NotImplementedError
+
+    @property
+    def source(self): return self._source
+    @property
+    def function(self):
+        return self._source.function \
+            if isinstance(self._source, InterpolationCurve) \
+            else self._source
+
+    def snapshot(self, function):
+        self._coefficients = function.coefficients[:]
+        return self
+    def changed_segments(self):
+        function = self.function.tabulated_argument()
+        coefficients, stride = function.coefficients, function.stride
+        if self._coefficients is None \
+                or len(coefficients) != len(self._coefficients):
+            return None
+        return [
+            i for i in range(function.size)
+            if coefficients[i * stride : (i + 1) * stride]
+                != self._coefficients[i * stride : (i + 1) * stride]
+        ]
+    def refresh(self):
+        segments = self.changed_segments()
+        return self.build() if segments is None else self.update(segments)
+    def update(self, segments):
+        function = self.function.tabulated_argument()
+        stride = function.stride
+        for i in segments:
+            self.update_segment(function, i)
+            self._coefficients[i * stride : (i + 1) * stride] = \
+                function.coefficients[i * stride : (i + 1) * stride]
+        return self
+
+
+class CurveSampleIndex(CurveSegmentIndex):
+    def __init__(self, source, tolerance=1e-3, cell_size=None, depth=16):
+        super().__init__(source)
+        self._tolerance = tolerance
+        self._cell_size = cell_size
+        self._depth = depth
+        self.build()
+
+    @property
+    def tolerance(self): return self._tolerance
+    @property
+    def cell_size(self): return self._cell_size
+    @property
+    def segments(self): return len(self._inputs)
+    @property
+    def samples(self): return sum(len(i) for i in self._inputs)
+    @property
+    def boxes(self): return tuple(self._boxes)
+
+    def build(self):
+        function = self.function.tabulated_argument()
+        self.snapshot(function)
+        self._inputs = [
+            function.adaptive_inputs(
+                self._tolerance, lower=i, upper=i + 1, depth=self._depth
+            )
+            for i in range(function.size)
+        ]
+        self._cell_size = self._cell_size if self._cell_size is not None \
+            else max(
+                sum(
+                    dist(*j) for i in self._inputs
+                    for j in self.sample_edges(function, i)
+                ) / max(4 * function.size, 1),
+                self._tolerance
+            )
+        self._points = [None] * function.size
+        self._boxes = [None] * function.size
+        self._cells = [()] * function.size
+        self._grid = {}
+        [self.sample_segment(function, i) for i in range(function.size)]
+        return self
+    def update_segment(self, function, segment):
+        self.remove_segment(segment)
+        self._inputs[segment] = function.adaptive_inputs(
+            self._tolerance, lower=segment, upper=segment + 1, 
+            depth=self._depth
+        )
+        return self.sample_segment(function, segment)
+
+    def sample_edges(self, function, inputs):
+        points = function.evaluate_many(inputs).row_buffers()
+        return zip(points[:-1], points[1:])
+    def sample_segment(self, function, segment):
+        inputs = self._inputs[segment]
+        refined = [inputs[0]]
+        for (lower, upper), (leading, trailing) in zip(
+            zip(inputs[:-1], inputs[1:]), self.sample_edges(function, inputs)
+        ):
+            pieces = max(ceil(dist(leading, trailing) / self._cell_size), 1)
+            refined.extend(
+                lower + (upper - lower) * i / pieces
+                for i in range(1, pieces + 1)
+            )
+        points = [
+            function.segment_output(segment, t - segment) for t in refined
+        ]
+        self._inputs[segment] = array("d", refined)
+        self._points[segment] = points
+        self._boxes[segment] = (
+            tuple(min(i) - self._tolerance for i in zip(*points)),
+            tuple(max(i) + self._tolerance for i in zip(*points))
+        )
+        cells = set()
+        for i, point in enumerate(points):
+            cell = self.cell(point)
+            cells.add(cell)
+            self._grid.setdefault(cell, []).append((segment, i))
+        self._cells[segment] = tuple(cells)
+        return self
+    def remove_segment(self, segment):
+        for cell in self._cells[segment]:
+            entries = [i for i in self._grid[cell] if i[0] != segment]
+            if entries:
+                self._grid[cell] = entries
+            else:
+                del self._grid[cell]
+        self._cells[segment] = ()
+        return self
+
+    def cell(self, point):
+        return tuple(floor(i / self._cell_size) for i in point)
+    def cell_entries(self, center, radius):
+        return (
+            j for i in product(
+                *(range(k - radius, k + radius + 1) for k in center)
+            )
+            for j in self._grid.get(i, ())
+        )
+    def searchable(self, center, radius):
+        return (2 * radius + 1)**len(center) <= len(self._grid)
+
+    def box_distance(self, segment, point):
+        lower, upper = self._boxes[segment]
+        return sum(
+            max(i - k, 0, k - j)**2 for i, j, k in zip(lower, upper, point)
+        )**0.5
+    def box_order(self, point):
+        return sorted(
+            (self.box_distance(i, point), i) for i in range(self.segments)
+        )
+    def segment_nearest_sample(self, segment, point):
+        return min(
+            (dist(v, point), i) for i, v in enumerate(self._points[segment])
+        )
+
+    def nearest_sample(self, point):
+        center = self.cell(point)
+        best, nearest = float("inf"), None
+        radius = 0
+        while self.searchable(center, radius) and (
+            nearest is None or best > (radius - 1) * self._cell_size
+        ):
+            for segment, i in self.cell_entries(center, radius):
+                distance = dist(self._points[segment][i], point)
+                best, nearest = (distance, (segment, i)) \
+                    if distance < best else (best, nearest)
+            radius += 1
+        if nearest is None or best > (radius - 1) * self._cell_size:
+            for box, segment in self.box_order(point):
+                if box > best:
+                    break
+                distance, i = self.segment_nearest_sample(segment, point)
+                best, nearest = (distance, (segment, i)) \
+                    if distance < best else (best, nearest)
+        return nearest, best
+    def candidates(self, point):
+        nearest, best = self.nearest_sample(point)
+        reach = best + self._cell_size / 2 + self._tolerance
+        radius = ceil(reach / self._cell_size)
+        candidates = {}
+        if not self.searchable(self.cell(point), radius):
+            for box, segment in self.box_order(point):
+                if box > reach:
+                    break
+                distance, i = self.segment_nearest_sample(segment, point)
+                candidates[segment] = (i, distance)
+        else:
+            for segment, i in self.cell_entries(self.cell(point), radius):
+                distance = dist(self._points[segment][i], point)
+                if distance <= reach and distance < candidates.get(
+                    segment, (None, float("inf"))
+                )[1]:
+                    candidates[segment] = (i, distance)
+        return sorted(
+            (box, segment, self._inputs[segment][i] - segment)
+            for segment, (i, distance) in candidates.items()
+            for box in (self.box_distance(segment, point),)
+            if box <= reach
+        )
+
+    def closest_point(self, point):
+        point = list(
+            point.elements if isinstance(point, TensorType) else point
+        )
+        function = self.function
+        best = None
+        for box, segment, t in self.candidates(point):
+            if best is not None and box > best[2]:
+                break
+            t = function.segment_closest_input(segment, point, t=t)
+            output = function.segment_output(segment, t)
+            distance = dist(output, point)
+            best = (segment + t, output, distance) \
+                if best is None or distance < best[2] else best
+        return best
+    def closest_points(self, queries):
+        queries = queries.row_buffers() if isinstance(queries, TensorType) \
+            else queries if isinstance(queries, Iterable) \
+            else [queries]
+        inputs, outputs, distances = array("d"), array("d"), array("d")
+        for t, output, distance in map(self.closest_point, queries):
+            inputs.append(t)
+            outputs.extend(output)
+            distances.append(distance)
+        return (
+            inputs,
+            Tensor(
+                self.function.dimension, height=len(inputs),
+                elements=outputs, link=True
+            ),
+            distances
+        )
+
+
+class BoundingVolumeHierarchy:
+    @staticmethod
+    def overlap(lower, upper, other_lower, other_upper):
+        return all(
+            i <= l and k <= j 
+            for i, j, k, l in zip(lower, upper, other_lower, other_upper)
+        )
+    @staticmethod
+    def merge(boxes):
+        boxes = list(boxes)
+        return (
+            tuple(map(min, *(i[0] for i in boxes))) if len(boxes) > 1 
+                else tuple(boxes[0][0]),
+            tuple(map(max, *(i[1] for i in boxes))) if len(boxes) > 1 
+                else tuple(boxes[0][1])
+        )
+
+    def __init__(self, boxes, leaf_size=4):
+        self._boxes = list(boxes)
+        self._leaf_size = leaf_size
+        self.build()
+
+    @property
+    def boxes(self): return tuple(self._boxes)
+    @property
+    def size(self): return len(self._boxes)
+    @property
+    def nodes(self): return len(self._children)
+    @property
+    def bounds(self): return self._bounds[0] if self._bounds else None
+
+    def build(self):
+        self._bounds, self._children, self._items = [], [], []
+        if not self._boxes:
+            return self
+        centers = [
+            [(i + j) / 2 for i, j in zip(*box)] for box in self._boxes
+        ]
+        stack = [(list(range(self.size)), None, 0)]
+        while stack:
+            items, parent, side = stack.pop()
+            node = len(self._children)
+            self._bounds.append(self.merge(self._boxes[i] for i in items))
+            self._children.append(None)
+            self._items.append(None)
+            if parent is not None:
+                self._children[parent][side] = node
+            if len(items) <= self._leaf_size:
+                self._items[node] = items
+                continue
+            lower, upper = self._bounds[node]
+            axis = max(range(len(lower)), key=lambda i: upper[i] - lower[i])
+            items.sort(key=lambda i: centers[i][axis])
+            middle = len(items) // 2
+            self._children[node] = [None, None]
+            stack.append((items[middle:], node, 1))
+            stack.append((items[:middle], node, 0))
+        return self
+    def set_box(self, index, box):
+        self._boxes[index] = box
+        return self
+    def refit(self):
+        for node in reversed(range(self.nodes)):
+            self._bounds[node] = self.merge(
+                self._boxes[i] for i in self._items[node]
+            ) if self._items[node] is not None else self.merge(
+                self._bounds[i] for i in self._children[node]
+            )
+        return self
+
+    def query(self, lower, upper):
+        items, stack = [], [0] if self._bounds else []
+        while stack:
+            node = stack.pop()
+            if not self.overlap(*self._bounds[node], lower, upper):
+                continue
+            if self._items[node] is None:
+                stack.extend(self._children[node])
+                continue
+            items.extend(
+                i for i in self._items[node] 
+                if self.overlap(*self._boxes[i], lower, upper)
+            )
+        return sorted(items)
+    def overlapping_pairs(self, other):
+        pairs, stack = [], [(0, 0)] if self._bounds and other._bounds else []
+        while stack:
+            node, other_node = stack.pop()
+            if not self.overlap(
+                *self._bounds[node], *other._bounds[other_node]
+            ):
+                continue
+            leaf = self._items[node] is not None
+            other_leaf = other._items[other_node] is not None
+            if leaf and other_leaf:
+                pairs.extend(
+                    (i, j) for i in self._items[node] 
+                    for j in other._items[other_node]
+                    if self.overlap(*self._boxes[i], *other._boxes[j])
+                )
+            elif other_leaf or not leaf and (
+                self.box_extent(node) >= other.box_extent(other_node)
+            ):
+                stack.extend(
+                    (i, other_node) for i in self._children[node]
+                )
+            else:
+                stack.extend(
+                    (node, i) for i in other._children[other_node]
+                )
+        return sorted(pairs)
+    def box_extent(self, node):
+        lower, upper = self._bounds[node]
+        return max(j - i for i, j in zip(lower, upper))
+
+
+class CurveBoundingHierarchy(CurveSegmentIndex):
+    def __init__(self, source, leaf_size=4, tolerance=1e-9, depth=48):
+        super().__init__(source)
+        self._leaf_size = leaf_size
+        self._tolerance = tolerance
+        self._depth = depth
+        self.build()
+
+    @property
+    def tolerance(self): return self._tolerance
+    @property
+    def hierarchy(self): return self._hierarchy
+    @property
+    def boxes(self): return self._hierarchy.boxes
+    @property
+    def bounds(self): return self._hierarchy.bounds
+
+    def build(self):
+        function = self.function.tabulated_argument()
+        self.snapshot(function)
+        self._hierarchy = BoundingVolumeHierarchy(
+            [function.segment_bounds(i) for i in range(function.size)],
+            leaf_size=self._leaf_size
+        )
+        return self
+    def update_segment(self, function, segment):
+        self._hierarchy.set_box(segment, function.segment_bounds(segment))
+        return self
+    def update(self, segments):
+        super().update(segments)
+        self._hierarchy.refit() if segments else None
+        return self
+
+    def segment_box_intervals(self, function, segment, lower, upper):
+        polynomials = function.segment_polynomials(segment)
+        cuts = {0, 1}
+        for coefficients, bounds in zip(polynomials, zip(lower, upper)):
+            for bound in bounds:
+                cuts.update(
+                    function.polynomial_roots(
+                        [coefficients[0] - bound, *coefficients[1:]]
+                    )
+                )
+        cuts = sorted(cuts)
+        return [
+            (segment + start, segment + end) 
+            for start, end in zip(cuts[:-1], cuts[1:])
+            if all(
+                i <= function.polynomial_value(j, (start + end) / 2) <= k
+                for i, j, k in zip(lower, polynomials, upper)
+            )
+        ]
+    def box_intervals(self, lower, upper):
+        lower = tuple(lower.elements if isinstance(lower, TensorType) else lower)
+        upper = tuple(upper.elements if isinstance(upper, TensorType) else upper)
+        function = self.function
+        intervals = []
+        for segment in self._hierarchy.query(lower, upper):
+            for start, end in self.segment_box_intervals(
+                function, segment, lower, upper
+            ):
+                if intervals and start - intervals[-1][1] <= self._tolerance:
+                    intervals[-1] = (intervals[-1][0], end)
+                else:
+                    intervals.append((start, end))
+        return intervals
+    def intersects_box(self, lower, upper):
+        return bool(self.box_intervals(lower, upper))
+
+    def intersection_sets(self, other):
+        other = other if isinstance(other, CurveBoundingHierarchy) \
+            else CurveBoundingHierarchy(other)
+        function, other_function = self.function, other.function
+        points, overlaps = [], []
+        for segment, other_segment in self._hierarchy.overlapping_pairs(
+            other._hierarchy
+        ):
+            self.segment_intersections(
+                function, segment, other_function, other_segment, 
+                points, overlaps
+            )
+        overlaps.sort()
+        merged = []
+        for interval, other_interval in overlaps:
+            if merged and interval[0] - merged[-1][0][1] <= 1e-9:
+                merged[-1] = (
+                    (merged[-1][0][0], max(merged[-1][0][1], interval[1])),
+                    (merged[-1][1][0], other_interval[1])
+                )
+            else:
+                merged.append((interval, other_interval))
+        points.sort()
+        return [
+            v for i, v in enumerate(points)
+            if (
+                i == 0 or abs(v[0] - points[i - 1][0]) > 1e-7 
+                or abs(v[1] - points[i - 1][1]) > 1e-7
+            ) and not any(
+                j[0] - 1e-9 <= v[0] <= j[1] + 1e-9 for j, k in merged
+            )
+        ], merged
+    def curve_intersections(self, other):
+        return self.intersection_sets(other)[0]
+    def curve_overlaps(self, other):
+        return self.intersection_sets(other)[1]
+
+    def hull(self, net):
+        return (
+            tuple(i - self._tolerance for i in map(min, *net)), 
+            tuple(i + self._tolerance for i in map(max, *net))
+        )
+    def chords(self, net, other_net):
+        chord = [j - i for i, j in zip(net[0], net[-1])]
+        other_chord = [j - i for i, j in zip(other_net[0], other_net[-1])]
+        offset = [i - j for i, j in zip(net[0], other_net[0])]
+        return (
+            sum(map(mul, chord, chord)), 
+            sum(map(mul, chord, other_chord)), 
+            sum(map(mul, other_chord, other_chord)), 
+            sum(map(mul, chord, offset)), 
+            sum(map(mul, other_chord, offset))
+        )
+    def segment_intersections(self, function, segment, other_function, 
+                              other_segment, points, overlaps):
+        stack = [
+            (
+                function.segment_control_net(segment), 0, 1, 
+                other_function.segment_control_net(other_segment), 0, 1, 0
+            )
+        ]
+        while stack:
+            net, start, end, other_net, other_start, other_end, level = \
+                stack.pop()
+            box, other_box = self.hull(net), self.hull(other_net)
+            if not BoundingVolumeHierarchy.overlap(*box, *other_box):
+                continue
+            extent = max(j - i for i, j in zip(*box)) - 2 * self._tolerance
+            other_extent = max(j - i for i, j in zip(*other_box)) \
+                - 2 * self._tolerance
+            flatness = function.control_net_flatness(net)
+            other_flatness = function.control_net_flatness(other_net)
+            a, b, c, d, e = self.chords(net, other_net)
+            transversal = a * c - b * b > 0.01 * a * c
+            linear = flatness <= 0.01 * extent \
+                and other_flatness <= 0.01 * other_extent
+            if linear and transversal \
+                    or max(extent, other_extent) <= self._tolerance:
+                s, u = ((b * e - c * d) / (a * c - b * b), 
+                    (a * e - b * d) / (a * c - b * b)) if transversal \
+                    else (0.5, 0.5)
+                solution = self.refine_intersection(
+                    function, segment, 
+                    start + (end - start) * min(max(s, 0), 1),
+                    other_function, other_segment, 
+                    other_start + (other_end - other_start) 
+                        * min(max(u, 0), 1)
+                )
+                if solution is not None \
+                        and start - 1e-9 <= solution[0] <= end + 1e-9 \
+                        and other_start - 1e-9 <= solution[1] \
+                            <= other_end + 1e-9:
+                    points.append(
+                        (
+                            segment + solution[0], 
+                            other_segment + solution[1], 
+                            solution[2]
+                        )
+                    )
+                continue
+            if flatness <= self._tolerance \
+                    and other_flatness <= self._tolerance:
+                self.collinear_overlap(
+                    function, segment, net, start, end, 
+                    other_function, other_segment, other_net, 
+                    other_start, other_end, points, overlaps
+                )
+                continue
+            if level >= self._depth:
+                continue
+            if extent >= other_extent:
+                middle = (start + end) / 2
+                leading, trailing = function.subdivide_control_net(net)
+                stack.append(
+                    (leading, start, middle, other_net, other_start, 
+                     other_end, level + 1)
+                )
+                stack.append(
+                    (trailing, middle, end, other_net, other_start, 
+                     other_end, level + 1)
+                )
+            else:
+                middle = (other_start + other_end) / 2
+                leading, trailing = function.subdivide_control_net(other_net)
+                stack.append(
+                    (net, start, end, leading, other_start, middle, 
+                     level + 1)
+                )
+                stack.append(
+                    (net, start, end, trailing, middle, other_end, 
+                     level + 1)
+                )
+        return points, overlaps
+    def collinear_overlap(self, function, segment, net, start, end, 
+                          other_function, other_segment, other_net, 
+                          other_start, other_end, points, overlaps):
+        origin = net[0]
+        chord = [j - i for i, j in zip(origin, net[-1])]
+        length = sum(map(mul, chord, chord))
+        if length == 0:
+            return self
+        projections = []
+        for point in (other_net[0], other_net[-1]):
+            offset = [j - i for i, j in zip(origin, point)]
+            projection = sum(map(mul, offset, chord)) / length
+            if dist(offset, [projection * i for i in chord]) \
+                    > self._tolerance:
+                return self
+            projections.append(projection)
+        lower, upper = max(min(projections), 0), min(max(projections), 1)
+        if (upper - lower) * length**0.5 < -self._tolerance:
+            return self
+        inputs = [
+            (
+                function.segment_closest_input(
+                    segment, point, t=start + (end - start) * i
+                ),
+                other_function.segment_closest_input(
+                    other_segment, point, 
+                    t=other_start + (other_end - other_start) * (
+                        (i - projections[0]) 
+                        / (projections[1] - projections[0])
+                        if projections[1] != projections[0] else 0
+                    )
+                ),
+                point
+            )
+            for i in (lower, upper)
+            for point in (
+                tuple(j + i * k for j, k in zip(origin, chord)),
+            )
+        ]
+        if (upper - lower) * length**0.5 <= self._tolerance:
+            points.append(
+                (segment + inputs[0][0], other_segment + inputs[0][1], 
+                 inputs[0][2])
+            )
+        else:
+            overlaps.append(
+                (
+                    (segment + inputs[0][0], segment + inputs[1][0]),
+                    (other_segment + inputs[0][1], 
+                     other_segment + inputs[1][1])
+                )
+            )
+        return self
+    def refine_intersection(self, function, segment, t, other_function, 
+                            other_segment, u, iterations=16):
+        for i in range(iterations):
+            position, velocity, acceleration = \
+                function.segment_output_derivatives(segment, t)
+            other_position, other_velocity, other_acceleration = \
+                other_function.segment_output_derivatives(other_segment, u)
+            offset = [j - k for j, k in zip(position, other_position)]
+            a = sum(j * j for j in velocity)
+            b = -sum(j * k for j, k in zip(velocity, other_velocity))
+            d = sum(j * j for j in other_velocity)
+            e = -sum(j * k for j, k in zip(velocity, offset))
+            f = sum(j * k for j, k in zip(other_velocity, offset))
+            determinant = a * d - b * b
+            if determinant == 0:
+                return None
+            step, other_step = (e * d - b * f) / determinant, \
+                (a * f - b * e) / determinant
+            t, u = t + step, u + other_step
+            if abs(step) + abs(other_step) <= 1e-12:
+                break
+        position = function.segment_output(segment, t)
+        return (t, u, position) \
+            if dist(position, other_function.segment_output(other_segment, u)) \
+                <= self._tolerance \
+            else None
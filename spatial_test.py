@@ -0,0 +1,71 @@
+from math import cos, dist, sin
+from random import Random
+
+from spatial import (
+    BoundingVolumeHierarchy, CurveBoundingHierarchy, CurveSampleIndex
+)
+from spline import (
+    ControlPoint, CubicSplineInterpolationCurve, InterpolationFunction
+)
+from tensor import Tensor
+
+
+def test_closest_points_match_brute_force():
+    curve = CubicSplineInterpolationCurve(
+        [ControlPoint(i, 3 * sin(i), cos(i)) for i in range(20)]
+    )
+    function = curve.function
+    index = CurveSampleIndex(curve)
+    random = Random(3)
+    queries = [
+        (random.uniform(-2, 21), random.uniform(-4, 4), random.uniform(-2, 2))
+        for i in range(40)
+    ]
+    samples = [function.output(i / 1000) for i in range(19001)]
+    inputs, outputs, distances = index.closest_points(
+        Tensor(3, height=40, elements=[j for i in queries for j in i])
+    )
+    assert (outputs.width, outputs.height) == (3, 40)
+    assert index.closest_points(queries)[0] == inputs
+    for t, output, distance, query in zip(
+        inputs, outputs.row_buffers(), distances, queries
+    ):
+        assert dist(function.output(t), output) <= 1e-12
+        assert abs(dist(output, query) - distance) <= 1e-12
+        assert distance <= min(dist(i, query) for i in samples) + 1e-12
+
+
+def test_bounding_volume_hierarchy_matches_brute_force():
+    random = Random(5)
+    boxes = []
+    for i in range(50):
+        x, y = random.uniform(0, 10), random.uniform(0, 10)
+        boxes.append(
+            ((x, y), (x + random.uniform(0, 2), y + random.uniform(0, 2)))
+        )
+    overlap = BoundingVolumeHierarchy.overlap
+    hierarchy = BoundingVolumeHierarchy(boxes, leaf_size=3)
+    other = BoundingVolumeHierarchy(boxes[:20], leaf_size=2)
+    assert hierarchy.query((2, 2), (5, 5)) == [
+        i for i, v in enumerate(boxes) if overlap(*v, (2, 2), (5, 5))
+    ]
+    assert hierarchy.overlapping_pairs(other) == [
+        (i, j) for i in range(50) for j in range(20) 
+        if overlap(*boxes[i], *boxes[j])
+    ]
+    assert BoundingVolumeHierarchy([]).query((0, 0), (1, 1)) == []
+
+
+def test_curve_intersections_and_overlaps():
+    line = CurveBoundingHierarchy(
+        InterpolationFunction.from_segments([[(0, 4), (0, 4)]])
+    )
+    crossing = InterpolationFunction.from_segments(
+        [[(0, 2), (4, -2)], [(2, 2), (2, -2)]]
+    )
+    overlapping = InterpolationFunction.from_segments([[(1, 2), (1, 2)]])
+    assert line.intersection_sets(crossing) == ([(0.5, 1, (2, 2))], [])
+    assert line.curve_intersections(overlapping) == []
+    assert line.curve_overlaps(overlapping) == [((0.25, 0.75), (0, 1))]
+    assert line.box_intervals((1, 0), (2, 5)) == [(0.25, 0.5)]
+    assert not line.intersects_box((3, 0), (5, 0.5))
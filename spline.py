@@ -1,24 +1,39 @@
-from collections.abc import Iterable
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
 from abc import ABC, abstractmethod
+from math import ceil, comb, log
 from numbers import Number
+from operator import add, le, mul, sub
 
+from tensor import Tensor, TensorType
 from vector import Vector
-from matrix import Matrix
+from matrix import TridiagonalMatrix
+from quaternion import OrientationTrack
+
+
+GAUSS_LEGENDRE = tuple(
+    ((1 + node) / 2, weight / 2) for node, weight in (
+        (-0.9061798459386640, 0.2369268850561891),
+        (-0.5384693101056831, 0.4786286704993665),
+        (0.0, 0.5688888888888889),
+        (0.5384693101056831, 0.4786286704993665),
+        (0.9061798459386640, 0.2369268850561891),
+    )
+)
 
 
 class ControlArm(Vector):
     def __init__(self, *elements, dimension=None, direction=None, **kwargs):
-        elements = elements if not elements \
-                or not isinstance(elements[0], ControlArm) \
-            else (elements[0]._elements,)
-        direction = direction if direction is not None \
-                or not elements \
-                or not isinstance(elements[0], ControlArm) \
-            else elements[0].direction
+        arm = elements[0] \
+            if elements and isinstance(elements[0], ControlArm) else None
+        elements = elements if arm is None else (arm._elements,)
+        direction = direction if direction is not None or arm is None \
+            else arm.direction
             
         super().__init__(*elements, dimension=dimension, **kwargs)
         
-        self._direction = 1
+        self._direction = 1 if arm is None else arm.direction
         self.set_direction(1 if direction is None else direction)
 
     @property
@@ -28,54 +43,25 @@ class ControlArm(Vector):
     @property
     def directional(self): 
         return Vector.new_tensor(
-            1, height=self.height, 
-            elements=[self._direction * i for i in self._elements]
+            1, height=self.height, elements=list(self._elements)
         )
 
-    @property
-    def elements(self): return self.directional.elements
-
     def set_direction(self, direction):
-        self._direction = direction // 1 % 1
+        direction = -1 if direction < 0 else 1
+        self.iscale(-1) if direction != self._direction else None
+        self._direction = direction
         return self
     
-    def get_index(self, *args):
-        return self._direction * super().get_index(*args)
-    def set_index(self, index, element):
-        return super().set_index(index, self._direction * element)
-    
-    def set_indices(self, indices, elements):
-        return super().set_indices(
-            indices, [self._direction * i for i in elements]
-            )
-    def set_elements(self, elements):
-        return super().set_elements(
-            [self._direction * i for i in elements]
-            )
-    def slice_elements(self, *args):
-        return self.directional.slice_elements(*args)
-    
-    def plane_angle(self, *args):
-        return self.directional.plane_angle(*args)
-
-    def dot_elements(self, *args):
-        return self.directional.dot_elements(*args)
-    def dot(self, *args):
-        return self.directional.dot(*args)
-    def cross(self, *args):
-        return self.directional.cross(*args)
-    
-    def equivalent(self, *args):
-        return self.directional.equivalent(*args)
-    
     def copy(self):
-        return super().copy(direction=self._direction)
+        arm = super().copy()
+        arm._direction = self._direction
+        return arm
 
 
 class ControlPoint(Vector):
     def __init__(self, *position, dimension=None, leading=None, trailing=None, 
-                 continuous=False):
-        super().__init__(*position, dimension=dimension)
+                 continuous=False, **kwargs):
+        super().__init__(*position, dimension=dimension, **kwargs)
         self._leading_arm = self._trailing_arm = None
 
         self.set_arm(
@@ -89,7 +75,7 @@ class ControlPoint(Vector):
     @property
     def continuous(self): 
         return not self.linear_leading and not self.linear_trailing \
-            and self._lead_arm.dot(self._trail_arm) == 1
+            and self._trailing_arm == -self._leading_arm
     @property
     def linear_leading(self):
         return self._leading_arm is None or self._leading_arm.is_empty
@@ -147,12 +133,233 @@ class ControlPoint(Vector):
             and self._trailing_arm == other._trailing_arm
 
 
+class ReadOnlyTensor:
+    def read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Points read from a ControlPointSet are read-only, "
+            "use ControlPointSet.set_point"
+        )
+    set_index = set_indices = set_elements = iadd = iscale = itranspose = \
+        idot = read_only
+
+
+class ReadOnlyVector(ReadOnlyTensor, Vector):
+    new_tensor = Vector.new_tensor
+
+
+class ReadOnlyControlPoint(ReadOnlyTensor, ControlPoint):
+    new_tensor = ControlPoint.new_tensor
+
+    def __init__(self, *position, dimension=None, leading=None, 
+                 trailing=None, continuous=False, **kwargs):
+        super().__init__(*position, dimension=dimension, **kwargs)
+        self._leading_arm = leading
+        self._trailing_arm = ReadOnlyVector(-leading) \
+            if continuous and leading is not None \
+            else trailing
+
+    set_leading_arm = set_trailing_arm = clear_arms = ReadOnlyTensor.read_only
+
+    def copy(self):
+        return ControlPoint(
+            list(self._elements), 
+            leading=None if self._leading_arm is None 
+                else self._leading_arm.copy(), 
+            trailing=None if self._trailing_arm is None 
+                else self._trailing_arm.copy()
+        )
+
+
+class ControlPointSet:
+    LEADING, TRAILING, CONTINUOUS = 1, 2, 4
+
+    @classmethod
+    def from_positions(cls, positions, dimension=None):
+        if not len(positions):
+            return cls(dimension=dimension)
+        points = cls(
+            dimension=dimension if dimension is not None 
+                else positions.width if isinstance(positions, TensorType) 
+                else len(positions[0])
+        )
+        points._positions.extend(
+            positions.elements if isinstance(positions, TensorType) 
+            else (j for i in positions for j in i)
+        )
+        size = len(points._positions) // points._dimension
+        points._leading.frombytes(bytes(8 * points._dimension * size))
+        points._trailing.frombytes(bytes(8 * points._dimension * size))
+        points._flags.extend(bytes(size))
+        return points
+
+    def __init__(self, points=None, dimension=None):
+        self._dimension = dimension
+        self._positions = array("d")
+        self._leading = array("d")
+        self._trailing = array("d")
+        self._flags = array("B")
+        self._indices = None
+        self.extend(() if points is None else points)
+
+    @property
+    def dimension(self): return self._dimension
+    @property
+    def size(self): return len(self._flags)
+    @property
+    def positions(self): return self.tensor(self._positions)
+    @property
+    def leading_arms(self): return self.tensor(self._leading)
+    @property
+    def trailing_arms(self): return self.tensor(self._trailing)
+    @property
+    def flags(self): return self._flags
+    @property
+    def indices(self):
+        if self._indices is None:
+            self._indices = {}
+            [
+                self._indices.setdefault(self.key(i), []).append(i) 
+                for i in range(self.size)
+            ]
+        return self._indices
+
+    def tensor(self, elements):
+        return Tensor(
+            self._dimension, height=self.size, elements=elements, link=True
+        )
+    def key(self, index):
+        dimension = self._dimension
+        return tuple(
+            self._positions[index * dimension : (index + 1) * dimension]
+        )
+    def position(self, index):
+        dimension, index = self._dimension, index % self.size
+        return self._positions[index * dimension : (index + 1) * dimension]
+    def leading_arm(self, index):
+        dimension, index = self._dimension, index % self.size
+        return ReadOnlyVector(
+            self._leading[index * dimension : (index + 1) * dimension]
+        ) if self._flags[index] & self.LEADING else None
+    def trailing_arm(self, index):
+        dimension, index = self._dimension, index % self.size
+        return ReadOnlyVector(
+            self._trailing[index * dimension : (index + 1) * dimension]
+        ) if self._flags[index] & self.TRAILING else None
+    def leading_elements(self, index):
+        dimension, index = self._dimension, index % self.size
+        return self._leading[index * dimension : (index + 1) * dimension]
+    def trailing_elements(self, index):
+        dimension, index = self._dimension, index % self.size
+        return self._trailing[index * dimension : (index + 1) * dimension]
+    def continuous(self, index): 
+        return bool(self._flags[index % self.size] & self.CONTINUOUS)
+    def point(self, index):
+        return ReadOnlyControlPoint(
+            self.position(index), 
+            leading=self.leading_arm(index), 
+            trailing=self.trailing_arm(index), 
+            continuous=self.continuous(index)
+        )
+
+    def point_elements(self, point):
+        point = point if isinstance(point, ControlPoint) \
+            else ControlPoint(point, dimension=self._dimension)
+        self._dimension = point.dimension if self._dimension is None \
+            else self._dimension
+        if point.dimension != self._dimension:
+            raise ValueError("Control point does not match the set dimension")
+        empty = bytes(8 * self._dimension)
+        return (
+            array("d", point.elements),
+            array("d", empty) if point.linear_leading 
+                else array("d", point.leading_arm.elements),
+            array("d", empty) if point.linear_trailing 
+                else array("d", point.trailing_arm.elements),
+            (0 if point.linear_leading else self.LEADING)
+                | (0 if point.linear_trailing else self.TRAILING)
+                | (self.CONTINUOUS if point.continuous else 0)
+        )
+    def equivalent(self, index, point):
+        return self.point(index).equivalent(point)
+
+    def set_point(self, index, point):
+        index %= self.size
+        dimension = self._dimension
+        position, leading, trailing, flags = self.point_elements(point)
+        self._positions[index * dimension : (index + 1) * dimension] = position
+        self._leading[index * dimension : (index + 1) * dimension] = leading
+        self._trailing[index * dimension : (index + 1) * dimension] = trailing
+        self._flags[index] = flags
+        self._indices = None
+        return self
+    def insert(self, index, point):
+        position, leading, trailing, flags = self.point_elements(point)
+        index = min(
+            index if index >= 0 else max(self.size + index, 0), self.size
+        )
+        offset = index * self._dimension
+        self._positions[offset : offset] = position
+        self._leading[offset : offset] = leading
+        self._trailing[offset : offset] = trailing
+        self._flags.insert(index, flags)
+        self._indices = None
+        return self
+    def append(self, point): return self.insert(self.size, point)
+    def extend(self, points):
+        [self.append(i) for i in points]
+        return self
+    def pop(self, index=-1):
+        index %= self.size
+        point = self.point(index)
+        dimension = self._dimension
+        del self._positions[index * dimension : (index + 1) * dimension]
+        del self._leading[index * dimension : (index + 1) * dimension]
+        del self._trailing[index * dimension : (index + 1) * dimension]
+        self._flags.pop(index)
+        self._indices = None
+        return point
+    def remove(self, point):
+        self.pop(self.index(point))
+        return self
+    def index(self, point):
+        point = point if isinstance(point, ControlPoint) \
+            else ControlPoint(point, dimension=self._dimension)
+        for i in self.indices.get(tuple(point.elements), ()):
+            if self.equivalent(i, point):
+                return i
+        raise ValueError("Control point is not in the set")
+    def has_point(self, point):
+        try:
+            return self.index(point) is not None
+        except ValueError:
+            return False
+
+    def copy(self):
+        points = self.__class__(dimension=self._dimension)
+        points._positions = self._positions[:]
+        points._leading = self._leading[:]
+        points._trailing = self._trailing[:]
+        points._flags = self._flags[:]
+        return points
+
+    def __len__(self): return self.size
+    def __getitem__(self, index): 
+        return [self.point(i) for i in range(self.size)[index]] \
+            if isinstance(index, slice) else self.point(index)
+    def __setitem__(self, index, point): self.set_point(index, point)
+    def __contains__(self, point): return self.has_point(point)
+    def __iter__(self): return (self.point(i) for i in range(self.size))
+
+
 class InterpolationCurve(ABC):
     def __init__(self, points=None):
-        self._points = points if isinstance(points, list) \
+        self._points = points if isinstance(points, (list, ControlPointSet)) \
             else list(points) if isinstance(points, Iterable) \
             else [points] if points \
             else []
+        self._function = None
+        self._edits = []
+        self._orientations = None
 
     @abstractmethod
     def generate_curve_function(): raise NotImplementedError
@@ -168,6 +375,15 @@ class InterpolationCurve(ABC):
     @property
     def points(self): return tuple(self._points)
     @property
+    def function(self):
+        self._function = self.generate_curve_function() \
+            if self._function is None \
+            else self.refit() if self._edits \
+            else self._function
+        return self._function
+    @property
+    def orientations(self): return self._orientations
+    @property
     def size(self): return len(self._points)
     @property
     def head(self): return self._points[0]
@@ -181,6 +397,24 @@ class InterpolationCurve(ABC):
     def dimension(self): return self._points[0].dimension 
 
     def point(self, point): return self._points[point]
+    def position_elements(self, point):
+        return self._points.position(point) \
+            if isinstance(self._points, ControlPointSet) \
+            else self._points[point]._elements
+    def arm_elements(self, point):
+        if isinstance(self._points, ControlPointSet):
+            return (
+                self._points.leading_elements(point), 
+                self._points.trailing_elements(point)
+            )
+        point = self._points[point]
+        return tuple(
+            [0] * point.dimension if linear else list(arm.elements)
+            for arm, linear in (
+                (point.leading_arm, point.linear_leading), 
+                (point.trailing_arm, point.linear_trailing)
+            )
+        )
     def index(self, point): return self._points.index(point)
     def linear(self, segment):
         return self._points[segment].trailing
@@ -195,19 +429,44 @@ class InterpolationCurve(ABC):
         return self.point(index + 1) if index < self.size - 1 else None
     def adjacent_points(self, point):
         return (
-            self.leading(point), self.trailing(point)
+            self.leading_point(point), self.trailing_point(point)
         )
     def insertable(self, index, point):
-        return self.leading(index) != point and self.trailing(index) != point
+        return self.empty or (
+            self.leading_point(index) != point 
+            and self.trailing_point(index) != point
+        )
     def has_point(self, point): return point in self._points
     
-    def set_point(self, index, point):
+    def invalidate(self):
+        self._function = None
+        self._edits = []
+        return self
+    def record_edit(self, index, offset=0): return self.invalidate()
+    def refit(self):
+        self._edits = []
+        return self.generate_curve_function()
+
+    def set_point(self, index, point, orientation=None):
         if self.insertable(index, point):
             self._points[index] = point
+            self._orientations.set_key(index, orientation) \
+                if self._orientations is not None and orientation is not None \
+                else None
+            self.record_edit(index % self.size)
         return self
-    def add_point(self, point, index=-1):
-        self._points.insert(index, point) if self.insertable(index, point) \
-            else None
+    def add_point(self, point, index=-1, orientation=None):
+        if self.insertable(index, point):
+            position = min(
+                index if index >= 0 else max(self.size + index, 0), self.size
+            )
+            self._points.insert(index, point)
+            self._orientations.add_key(
+                self._orientations[min(position, self._orientations.size - 1)]
+                    if orientation is None else orientation, 
+                index=position
+            ) if self._orientations is not None else None
+            self.record_edit(position, 1)
         return self
     def extend_curve(self, points, index=-1):
         [
@@ -216,14 +475,44 @@ class InterpolationCurve(ABC):
         ]
         return self
     def remove_point(self, point):
-        self._points.pop(point) if isinstance(point, int) \
-            else self._points.remove(point) \
-                if point in self._points else None
+        index = point % self.size if isinstance(point, int) \
+            else self.index(point) if point in self._points \
+            else None
+        if index is not None:
+            self._points.pop(index)
+            self._orientations.remove_key(index) \
+                if self._orientations is not None else None
+            self.record_edit(index, -1)
         return self
     def remove_points(self, points):
         [self.remove_point(i) for i in points]
         return self
 
+    def set_orientations(self, orientations, interpolation="squad"):
+        orientations = orientations if isinstance(orientations, OrientationTrack) \
+            else OrientationTrack(orientations, interpolation=interpolation)
+        if orientations.size != self.size:
+            raise ValueError("Orientation track does not match the curve points")
+        self._orientations = orientations
+        return self
+    def set_orientation(self, index, orientation):
+        self._orientations.set_key(index, orientation)
+        return self
+    def clear_orientations(self):
+        self._orientations = None
+        return self
+
+    def orientation(self, t): return self._orientations.output(t)
+    def pose(self, t): return self.function.output(t), self.orientation(t)
+    def evaluate_poses(self, ts):
+        ts = ts if isinstance(ts, Sequence) else list(ts)
+        function = self.function
+        buckets = list(function.segment_buckets(ts))
+        return (
+            function.evaluate_many(ts, buckets=buckets), 
+            self._orientations.evaluate_many(ts, buckets=buckets)
+        )
+
     def __iadd__(self, point):
         self.extend_curve(point) if isinstance(point, Iterable) \
             else self.add_point(point)
@@ -231,7 +520,7 @@ class InterpolationCurve(ABC):
         self.remove_points(point) if isinstance(point, Iterable) \
             else self.remove_point(point)
 
-    def __getitem__(self, index): return self.points(index)
+    def __getitem__(self, index): return self.point(index)
     def __setitem__(self, index, point): self.set_point(index, point)
     def __contains__(self, point): return self.has_point(point)
     def __iter__(self): return iter(self._points)
@@ -242,91 +531,425 @@ class InterpolationCurve(ABC):
 
 
 class CubicSplineInterpolationCurve(InterpolationCurve):        
+    def __init__(self, points=None, incremental=False, tolerance=None):
+        super().__init__(points)
+        self._incremental = incremental
+        self._tolerance = 1e-9 if tolerance is None else tolerance
+        self._derivatives = None
+        self._scale = 0
+
     @staticmethod
     def closed_coefficients(size):
-        coefficients = Matrix.empty(size)
-        for i in range(size):
-            coefficients[i * size, i] = 4
-            if i > 0:
-                coefficients[i * size, i - 1] = 1
-            if i > size - 1:
-                coefficients[i * size, i + 1] = 1
-        coefficients[0, size - 1] = 1
-        coefficients[size * (size - 1), 0]
-        return coefficients
+        return TridiagonalMatrix.fill(size, 1, 4, 1, cyclic=True)
 
     @staticmethod
-    def open_coefficients(self, size):
-        coefficients = Matrix.empty(size)
-        for i in range(size):
-            coefficients[i * size, i] = 2 \
-                if i == 0 or i == size - 1 \
-                else 4
-            if i > 0:
-                coefficients[i * size, i - 1] = 1
-            if i > size - 1:
-                coefficients[i * size, i + 1] = 1
+    def open_coefficients(size):
+        coefficients = TridiagonalMatrix.fill(size, 1, 4, 1)
+        coefficients.diagonal[0] = coefficients.diagonal[-1] = 2
         return coefficients
     
+    @property
+    def incremental(self): return self._incremental
+    @property
+    def tolerance(self): return self._tolerance
+    @property
+    def scale(self): return self._scale
+    @property
+    def locality(self): 
+        return max(
+            ceil(
+                log(self._tolerance / (24 * self._scale)) / log(2 - 3**0.5)
+            ), 1
+        ) if 24 * self._scale > self._tolerance else 1
+    @property
+    def knots(self): return self.size if self.open else self.size - 1
+    @property
+    def segments(self): return self.size - 1
     @property
     def coefficients(self):
-        return self.open_coefficients(self.size) if self.open \
-            else self.closed_coefficients(self.size)
+        return self.open_coefficients(self.knots) if self.open \
+            else self.closed_coefficients(self.knots)
+    
     @property
-    def resultants(self):
-        return (
-            self.resultants(i) for i in range(self.dimension)
+    def positions(self):
+        if isinstance(self._points, ControlPointSet):
+            return self._points.positions
+        elements = array("d")
+        [elements.extend(i._elements) for i in self._points]
+        return Tensor(
+            self.dimension, height=self.size, elements=elements, link=True
         )
     
-    def generate_curve_function(self):
-        coefficients = self.coefficients.inverse
-        resultants = self.resultants
-        derivatives = [
-            coefficients.transform(i) for i in resultants
+    @staticmethod
+    def step_scale(positions):
+        return max(
+            (
+                max(map(abs, map(sub, i, j))) 
+                for i, j in zip(positions[:-1], positions[1:])
+            ), default=0
+        )
+
+    def derivatives(self, positions=None):
+        return self.coefficients.solve_many(
+            self.resultants(positions=positions)
+        )
+
+    @staticmethod
+    def hermite_coefficients(leading, trailing, first_degrees, adjacents):
+        return [
+            [
+                constant,
+                first_degree,
+                3 * (end - constant) - 2 * first_degree - adjacent,
+                -2 * (end - constant) + first_degree + adjacent
+            ]
+            for constant, end, first_degree, adjacent in zip(
+                leading, trailing, first_degrees, adjacents
+            )
         ]
 
-        functions = []
-        for i in range(self.size):
-            coefficient_sets = []
-            for j in range(self.dimension):
-                resultant = resultants[j][i]
-                adjacent = derivatives[j][i + 1] \
-                    if i < self.size - 1 else 0
-
-                constant = self.point(i)[j]
-                first_degree = derivatives[j][i]
-                coefficient_sets.append(
-                    [
-                        constant,
-                        first_degree,
-                        resultant - 2 * first_degree - adjacent,
-                        -2/3 * resultant + first_degree + adjacent
-                    ]
+    def generate_curve_function(self):
+        positions = self.positions
+        derivatives = self.derivatives(positions=positions)
+        positions = positions.row_buffers()
+        derivatives = derivatives.row_buffers()
+        self._derivatives = derivatives if self.open else None
+        self._scale = self.step_scale(positions)
+        knots = self.knots
+        coefficients = array("d")
+        for i in range(self.segments):
+            [
+                coefficients.extend(j) 
+                for j in self.hermite_coefficients(
+                    positions[i], 
+                    positions[i + 1], 
+                    derivatives[i], 
+                    derivatives[(i + 1) % knots]
                 )
-            functions.append(
-                InterpolationFunction.polynonmial_array(
-                    coefficient_sets,
-                    dimension=self.dimension, 
-                    parameters=4
-                )    
+            ]
+        return InterpolationFunction(
+            coefficients=coefficients, dimension=self.dimension, degree=3
+        )
+
+    def generate_segment_function(self, segment, derivatives=None, 
+                                  positions=None):
+        positions = self.positions if positions is None else positions
+        derivatives = self.derivatives(positions=positions) \
+            if derivatives is None else derivatives
+        return InterpolationFunction.polynomial_array(
+            self.hermite_coefficients(
+                positions.row(segment), 
+                positions.row(segment + 1),
+                derivatives.row(segment),
+                derivatives.row((segment + 1) % self.knots)
+            ),
+            dimension=self.dimension, 
+            parameters=4
+        )
+
+    def record_edit(self, index, offset=0):
+        if not self._incremental or self._function is None \
+                or self._derivatives is None or self.closed \
+                or self.size < 3:
+            return self.invalidate()
+        if offset > 0:
+            self._derivatives.insert(
+                index, array("d", bytes(8 * self.dimension))
+            )
+            self._function.add_segment(
+                [], index=min(index, self._function.size)
+            )
+        elif offset < 0:
+            self._derivatives.pop(index)
+            self._function.remove_segment(
+                min(index, self._function.size - 1)
+            )
+        self._edits = [
+            i + offset if i > index or (i == index and offset > 0) else i
+            for i in self._edits
+        ]
+        self._edits.append(
+            min(index, self.size - 1)
+        )
+        self._scale = max(
+            self._scale, 
+            self.step_scale(
+                [
+                    self.position_elements(i) for i in range(
+                        max(index - 1, 0), min(index + 2, self.size)
+                    )
+                ]
             )
-        return InterpolationFunction(functions=functions)
-
-    def resultants(self, dimension):
-        resultants = [] 
-        for i in range(self.size):
-            m = (0 if i < 1 else i - 1) if self.open \
-                else (i - 1) % self.size
-            n = (self.size - 1 if i > self.size - 2 else i + 1) \
-                if self.open else (i + 1) % self.size
-            resultants.append(
-                3 * (
-                    self.point(n)[dimension] - self.point(m)[dimension]
+        )
+        return self
+
+    def refit(self):
+        size, reach = self.size, self.locality + 1
+        if self._derivatives is None or self.closed \
+                or len(self._derivatives) != size:
+            return super().refit()
+        bands = []
+        for i in sorted(self._edits):
+            start, stop = max(i - reach, 0), min(i + reach, size - 1)
+            if bands and start <= bands[-1][1] + 1:
+                bands[-1][1] = max(bands[-1][1], stop)
+            else:
+                bands.append([start, stop])
+        if sum(j - i + 1 for i, j in bands) > size // 2:
+            return super().refit()
+        self._edits = []
+        [self.refit_band(*i) for i in bands]
+        return self._function
+
+    def refit_band(self, start, stop):
+        size, derivatives = self.size, self._derivatives
+        positions = {
+            i: self.position_elements(i) 
+            for i in range(max(start - 1, 0), min(stop + 1, size - 1) + 1)
+        }
+        resultants = array("d")
+        for i in range(start, stop + 1):
+            resultant = [
+                3 * (j - k) for j, k in zip(
+                    positions[min(i + 1, size - 1)], positions[max(i - 1, 0)]
+                )
+            ]
+            resultant = list(
+                map(sub, resultant, derivatives[start - 1])
+            ) if i == start and start > 0 else resultant
+            resultant = list(
+                map(sub, resultant, derivatives[stop + 1])
+            ) if i == stop and stop < size - 1 else resultant
+            resultants.extend(resultant)
+        band = stop - start + 1
+        derivatives[start : stop + 1] = TridiagonalMatrix(
+            [1] * band,
+            [2 if i == 0 or i == size - 1 else 4 for i in range(start, stop + 1)],
+            [1] * band
+        ).solve_many(
+            Tensor(self.dimension, height=band, elements=resultants, link=True)
+        ).row_buffers()
+        [
+            self._function.set_segment(
+                i, self.hermite_coefficients(
+                    positions[i], 
+                    positions[i + 1], 
+                    derivatives[i], 
+                    derivatives[i + 1]
                 )
             )
-        return Vector(resultants)
+            for i in range(max(start - 1, 0), min(stop, size - 2) + 1)
+        ]
+        return self
+
+    def resultants(self, dimension=None, positions=None):
+        positions = (
+            self.positions if positions is None else positions
+        ).row_buffers()
+        knots, open = self.knots, self.open
+        elements = array("d")
+        for i in range(knots):
+            m = max(i - 1, 0) if open else (i - 1) % knots
+            n = min(i + 1, knots - 1) if open else (i + 1) % knots
+            elements.extend(
+                3 * (j - k) for j, k in zip(positions[n], positions[m])
+            )
+        resultants = Tensor(
+            self.dimension, height=knots, elements=elements, link=True
+        )
+        return resultants if dimension is None \
+            else Vector(resultants.column(dimension))
 
     
+class BezierInterpolationCurve(InterpolationCurve):
+    def __init__(self, points=None):
+        super().__init__(points)
+
+    @property
+    def segments(self): return max(self.size - 1, 0)
+    @property
+    def control_nets(self):
+        return tuple(
+            self.control_net(i) for i in range(self.segments)
+        )
+
+    def control_net(self, segment):
+        leading, trailing = self.position_elements(segment), \
+            self.position_elements(segment + 1)
+        handle = self.arm_elements(segment)[1]
+        other_handle = self.arm_elements(segment + 1)[0]
+        return (
+            tuple(leading), 
+            tuple(map(add, leading, handle)), 
+            tuple(map(add, trailing, other_handle)), 
+            tuple(trailing)
+        )
+    def segment_coefficients(self, segment):
+        return CubicSplineInterpolationCurve.hermite_coefficients(
+            self.position_elements(segment), 
+            self.position_elements(segment + 1),
+            [3 * i for i in self.arm_elements(segment)[1]],
+            [-3 * i for i in self.arm_elements(segment + 1)[0]]
+        )
+
+    def generate_curve_function(self):
+        coefficients = array("d")
+        for i in range(self.segments):
+            [coefficients.extend(j) for j in self.segment_coefficients(i)]
+        return InterpolationFunction(
+            coefficients=coefficients, dimension=self.dimension, degree=3
+        )
+    def generate_segment_function(self, segment):
+        return InterpolationFunction.polynomial_array(
+            self.segment_coefficients(segment), 
+            dimension=self.dimension, 
+            parameters=4
+        )
+
+    def record_edit(self, index, offset=0):
+        if self._function is None:
+            return self.invalidate()
+        if offset > 0:
+            self._function.add_segment(
+                [], index=min(index, self._function.size)
+            )
+        elif offset < 0:
+            self._function.remove_segment(
+                min(index, self._function.size - 1)
+            )
+        self._edits = [
+            i + offset if i > index or (i == index and offset > 0) else i
+            for i in self._edits
+        ]
+        self._edits.append(index)
+        return self
+    def refit(self):
+        if self._function.size != self.segments:
+            return super().refit()
+        [
+            self._function.set_segment(j, self.segment_coefficients(j))
+            for j in sorted(
+                set(
+                    j for i in self._edits for j in (i - 1, i)
+                    if 0 <= j < self.segments
+                )
+            )
+        ]
+        self._edits = []
+        return self._function
+
+
+class StreamingCubicSplineBuilder:
+    def __init__(self, tolerance=None):
+        self._tolerance = 1e-9 if tolerance is None else tolerance
+        self._positions = []
+        self._derivative = None
+        self._segments = 0
+        self._scale = 0
+
+    @property
+    def tolerance(self): return self._tolerance
+    @property
+    def scale(self): return self._scale
+    @property
+    def locality(self): 
+        return max(
+            ceil(
+                log(self._tolerance / (12 * self._scale)) / log(2 - 3**0.5)
+            ), 1
+        ) if 12 * self._scale > self._tolerance else 1
+    @property
+    def buffered(self): return len(self._positions)
+    @property
+    def segments(self): return self._segments
+    @property
+    def dimension(self): 
+        return len(self._positions[0]) if self._positions else None
+
+    def solve(self):
+        positions, fixed = self._positions, self._derivative
+        offset = 0 if fixed is None else 1
+        count = len(positions) - offset
+        resultants = array("d")
+        for i in range(offset, len(positions)):
+            resultant = [
+                3 * (j - k) for j, k in zip(
+                    positions[min(i + 1, len(positions) - 1)], 
+                    positions[max(i - 1, 0)]
+                )
+            ]
+            resultants.extend(
+                map(sub, resultant, fixed) if i == offset and fixed is not None 
+                else resultant
+            )
+        diagonal = [4] * count
+        diagonal[-1] = 2
+        diagonal[0] = 2 if fixed is None else diagonal[0]
+        return TridiagonalMatrix(
+            [1] * count, diagonal, [1] * count
+        ).solve_many(
+            Tensor(self.dimension, height=count, elements=resultants, link=True)
+        ).row_buffers()
+
+    def segment(self, index, derivatives):
+        self._segments += 1
+        return CubicSplineInterpolationCurve.hermite_coefficients(
+            self._positions[index], 
+            self._positions[index + 1], 
+            derivatives[index], 
+            derivatives[index + 1]
+        )
+
+    def push(self, point):
+        position = array(
+            "d", point.elements if isinstance(point, TensorType) else point
+        )
+        if self._positions and len(position) != self.dimension:
+            raise ValueError("Point dimension does not match the stream")
+        self._scale = max(
+            self._scale, 
+            max(map(abs, map(sub, position, self._positions[-1])))
+        ) if self._positions else self._scale
+        self._positions.append(position)
+        offset = 0 if self._derivative is None else 1
+        if len(self._positions) - offset <= self.locality:
+            return []
+        derivative = self.solve()[0]
+        segments = [] if self._derivative is None \
+            else [self.segment(0, [self._derivative, derivative])]
+        self._positions = self._positions[offset:]
+        self._derivative = derivative
+        return segments
+    def finish(self):
+        if len(self._positions) < 2:
+            self._positions, self._derivative, self._scale = [], None, 0
+            return []
+        derivatives = self.solve()
+        derivatives = derivatives if self._derivative is None \
+            else [self._derivative] + derivatives
+        segments = [
+            self.segment(i, derivatives) 
+            for i in range(len(self._positions) - 1)
+        ]
+        self._positions, self._derivative, self._scale = [], None, 0
+        return segments
+
+    def stream(self, points):
+        for point in points:
+            yield from self.push(point)
+        yield from self.finish()
+    async def astream(self, points):
+        async for point in points:
+            for segment in self.push(point):
+                yield segment
+        for segment in self.finish():
+            yield segment
+    def function(self, points):
+        return InterpolationFunction.from_segments(
+            self.stream(points), degree=3
+        )
+
+
 class InterpolationFunction:
     @staticmethod
     def polynomial(*coefficients, parameters=None):
@@ -334,7 +957,7 @@ class InterpolationFunction:
             else parameters
         coefficients = (
             list(coefficients) + [0] * parameters
-        )[parameters] 
+        )[:parameters]
         return lambda t: sum(
                 t**i * v for i, v in enumerate(coefficients) 
             )
@@ -344,45 +967,263 @@ class InterpolationFunction:
             else dimension
         coefficient_sets = (
             list(coefficient_sets) + [[]] * dimension
-        )[dimension]
+        )[:dimension]
         functions = tuple(
             cls.polynomial(*i, **kwargs) for i in coefficient_sets 
         )
-        raise lambda t: tuple(
+        return lambda t: tuple(
             i(t) for i in functions
         )
 
-    def __init__(self, functions=None):
-        self._functions = functions if isinstance(functions, list) \
-            else list(functions) if isinstance(function, Iterable) \
+    @staticmethod
+    def polynomial_value(coefficients, t):
+        output = 0
+        for coefficient in reversed(coefficients):
+            output = output * t + coefficient
+        return output
+    @classmethod
+    def polynomial_roots(cls, coefficients, lower=0, upper=1, 
+                         tolerance=1e-14, iterations=64):
+        coefficients = list(coefficients)
+        while coefficients and coefficients[-1] == 0:
+            coefficients.pop()
+        degree = len(coefficients) - 1
+        if degree < 1:
+            return []
+        elif degree == 1:
+            roots = [-coefficients[0] / coefficients[1]]
+        elif degree == 2:
+            c, b, a = coefficients
+            discriminant = b**2 - 4 * a * c
+            if discriminant < 0:
+                return []
+            q = -(b + (discriminant**0.5 if b >= 0 else -discriminant**0.5)) / 2
+            roots = [q / a] + ([c / q] if q != 0 else [])
+        else:
+            bounds = [lower] + cls.polynomial_roots(
+                [i * v for i, v in enumerate(coefficients)][1:], 
+                lower, upper, tolerance=tolerance, iterations=iterations
+            ) + [upper]
+            roots = [
+                lower
+            ] if cls.polynomial_value(coefficients, lower) == 0 else []
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                leading = cls.polynomial_value(coefficients, start)
+                trailing = cls.polynomial_value(coefficients, end)
+                if trailing == 0:
+                    roots.append(end)
+                    continue
+                if leading == 0 or (leading < 0) == (trailing < 0):
+                    continue
+                for i in range(iterations):
+                    middle = (start + end) / 2
+                    value = cls.polynomial_value(coefficients, middle)
+                    if value == 0 or end - start <= tolerance:
+                        break
+                    start, end = (middle, end) \
+                        if (value < 0) == (leading < 0) else (start, middle)
+                roots.append(middle)
+        return sorted(
+            set(i for i in roots if lower <= i <= upper)
+        )
+
+    @classmethod
+    def polynomial_bounds(cls, polynomials, lower=0, upper=1):
+        bounds = []
+        for coefficients in polynomials:
+            values = [
+                cls.polynomial_value(coefficients, t) for t in (
+                    lower, upper, *cls.polynomial_roots(
+                        [i * v for i, v in enumerate(coefficients)][1:],
+                        lower, upper
+                    )
+                )
+            ]
+            bounds.append((min(values), max(values)))
+        return tuple(i[0] for i in bounds), tuple(i[1] for i in bounds)
+
+    @staticmethod
+    def bernstein_coefficients(coefficients):
+        degree = len(coefficients) - 1
+        return [
+            sum(
+                comb(i, j) / comb(degree, j) * coefficients[j] 
+                for j in range(i + 1)
+            )
+            for i in range(degree + 1)
+        ]
+    @staticmethod
+    def power_coefficients(controls):
+        degree = len(controls) - 1
+        return [
+            comb(degree, j) * sum(
+                (-1)**(j - i) * comb(j, i) * controls[i] 
+                for i in range(j + 1)
+            )
+            for j in range(degree + 1)
+        ]
+    @staticmethod
+    def subdivide_control_net(net, t=0.5):
+        leading, trailing = [net[0]], [net[-1]]
+        while len(net) > 1:
+            net = [
+                tuple(i + (j - i) * t for i, j in zip(a, b)) 
+                for a, b in zip(net[:-1], net[1:])
+            ]
+            leading.append(net[0])
+            trailing.append(net[-1])
+        return tuple(leading), tuple(trailing[::-1])
+    @staticmethod
+    def control_net_flatness(net):
+        leading, trailing = net[0], net[-1]
+        chord = [j - i for i, j in zip(leading, trailing)]
+        length = sum(i**2 for i in chord)
+        deviation = 0
+        for point in net[1:-1]:
+            offset = [j - i for i, j in zip(leading, point)]
+            projection = min(
+                max(sum(map(mul, offset, chord)) / length, 0), 1
+            ) if length > 0 else 0
+            deviation = max(
+                deviation,
+                sum(
+                    (i - projection * j)**2 for i, j in zip(offset, chord)
+                )**0.5
+            )
+        return deviation
+    @classmethod
+    def from_control_nets(cls, nets, dimension=None):
+        nets = [list(i) for i in nets]
+        dimension = len(nets[0][0]) if dimension is None and nets \
+            else 1 if dimension is None \
+            else dimension
+        function = cls(
+            coefficients=(), dimension=dimension, 
+            degree=max((len(i) for i in nets), default=4) - 1
+        )
+        [
+            function.add_segment(
+                function.control_net_coefficients(i), index=function.size
+            ) 
+            for i in nets
+        ]
+        return function
+
+    @classmethod
+    def from_segments(cls, segments, dimension=None, degree=None):
+        segments = list(segments)
+        dimension = len(segments[0]) if dimension is None and segments \
+            else 1 if dimension is None \
+            else dimension
+        degree = max(
+            (len(j) for i in segments for j in i), default=4
+        ) - 1 if degree is None else degree
+        function = cls(coefficients=(), dimension=dimension, degree=degree)
+        [function.add_segment(i, index=function.size) for i in segments]
+        return function
+
+    def __init__(self, functions=None, coefficients=None, dimension=None, 
+                 degree=None):
+        self._functions = None if coefficients is not None \
+            else functions if isinstance(functions, list) \
+            else list(functions) if isinstance(functions, Iterable) \
             else [functions] if functions else []
+        self._coefficients = array("d", coefficients) \
+            if coefficients is not None else None
+        self._dimension = 1 if dimension is None else dimension
+        self._degree = 3 if degree is None else degree
+        self._velocity = self._arc_lengths = None
     
     @property
-    def functions(self): return tuple(self._functions)
+    def tabulated(self): return self._coefficients is not None
+    @property
+    def coefficients(self): return self._coefficients
+    @property
+    def dimension(self): return self._dimension
     @property
-    def size(self): return len(self._functions)
+    def degree(self): return self._degree
+    @property
+    def parameters(self): return self._degree + 1
+    @property
+    def stride(self): return self._dimension * (self._degree + 1)
+    @property
+    def segments(self): 
+        return tuple(
+            self.segment(i) for i in range(self.size)
+        )
+    @property
+    def functions(self): 
+        return tuple(
+            self.function(i) for i in range(self.size)
+        ) if self.tabulated else tuple(self._functions)
+    @property
+    def size(self): 
+        return len(self._coefficients) // self.stride if self.tabulated \
+            else len(self._functions)
+    @property
+    def velocity(self):
+        self._velocity = self.derivative() if self._velocity is None \
+            else self._velocity
+        return self._velocity
+    @property
+    def arc_lengths(self):
+        if self._arc_lengths is None:
+            self._arc_lengths = array("d", [0])
+            [
+                self._arc_lengths.append(
+                    self._arc_lengths[-1] + self.segment_arc_length(i)
+                ) for i in range(self.size)
+            ]
+        return self._arc_lengths
+    @property
+    def arc_length(self): return self.arc_lengths[-1]
 
-    def function(self, index): return self._functions[index]
+    def function(self, index): 
+        return self.segment_function(index) if self.tabulated \
+            else self._functions[index]
     def input_function(self, t): 
         return self.function(
             self.function_index(t)
         ) 
+    def invalidate(self):
+        self._velocity = self._arc_lengths = None
+        return self
     def set_function(self, index, function): 
+        self.invalidate()
+        if self.tabulated:
+            return self.set_segment(index, self.segment_argument(function))
         self._functions[index] = function
         return self
     
-    def has_function(self, function): return function in self._functions
+    def has_function(self, function): 
+        return self.has_segment(self.segment_argument(function)) \
+            if self.tabulated else function in self._functions
     def add_function(self, function, index=-1):
+        self.invalidate()
+        if self.tabulated:
+            return self.add_segment(
+                self.segment_argument(function), index=index
+            )
         self._functions.insert(index, function)
         return self
     def extend_functions(self, functions, index=-1):
-        self._functions.extend(functions) if index == -1 \
+        [
+            self.add_function(i, index=self.size) for i in functions
+        ] if self.tabulated and index == -1 \
+            else self._functions.extend(functions) if index == -1 \
             else [
                 self.add_function(i, index=index) 
                 for i in functions[::-1 if index >= 0 else 1]
             ]
         return self
     def remove_function(self, function):
+        self.invalidate()
+        if self.tabulated:
+            index = function if isinstance(function, int) \
+                else self.segment_index(function) \
+                    if self.has_function(function) \
+                else None
+            return self.remove_segment(index) if index is not None else self
         self._functions.pop(function) if isinstance(function, int) \
             else self._functions.remove(function) \
                 if function in self._functions else None
@@ -391,23 +1232,418 @@ class InterpolationFunction:
         [self.remove_function(i) for i in functions]
         return self
 
-    def function_index(self, t): return int(t // 1)
-    def function_input(self, t): return t % 1
+    def tabulated_argument(self):
+        if not self.tabulated:
+            raise TypeError(
+                "Interpolation function has no coefficient table"
+            )
+        return self
+    def segment_argument(self, segment):
+        if callable(segment):
+            raise TypeError(
+                "Tabulated interpolation functions take coefficient sets"
+            )
+        return segment
+    def segment_slice(self, index):
+        index = index % self.size if self.size else index
+        return slice(index * self.stride, (index + 1) * self.stride)
+    def pack_segment(self, coefficient_sets):
+        parameters = self.parameters
+        segment = array("d")
+        coefficient_sets = list(coefficient_sets)
+        for i in range(self._dimension):
+            coefficients = list(coefficient_sets[i]) \
+                if i < len(coefficient_sets) else []
+            segment.extend(
+                (coefficients + [0] * parameters)[:parameters]
+            )
+        return segment
+    def segment(self, index):
+        segment = self._coefficients[self.segment_slice(index)]
+        return tuple(
+            tuple(segment[i : i + self.parameters])
+            for i in range(0, self.stride, self.parameters)
+        )
+    def segment_index(self, coefficient_sets):
+        segment = self.pack_segment(coefficient_sets)
+        return next(
+            i for i in range(self.size) 
+            if self._coefficients[self.segment_slice(i)] == segment
+        )
+    def has_segment(self, coefficient_sets):
+        segment = self.pack_segment(coefficient_sets)
+        return any(
+            self._coefficients[self.segment_slice(i)] == segment
+            for i in range(self.size)
+        )
+    def set_segment(self, index, coefficient_sets):
+        self._coefficients[self.segment_slice(index)] = \
+            self.pack_segment(coefficient_sets)
+        return self.invalidate()
+    def add_segment(self, coefficient_sets, index=-1):
+        index = index if index >= 0 else max(self.size + index, 0)
+        index = min(index, self.size) * self.stride
+        self._coefficients[index : index] = self.pack_segment(
+            coefficient_sets
+        )
+        return self.invalidate()
+    def remove_segment(self, index):
+        del self._coefficients[self.segment_slice(index)]
+        return self.invalidate()
+    def segment_polynomials(self, index):
+        segment = self._coefficients[self.segment_slice(index)]
+        return [
+            segment[i : i + self.parameters]
+            for i in range(0, self.stride, self.parameters)
+        ]
+    def control_net_coefficients(self, net):
+        return [
+            self.power_coefficients(i) for i in zip(*net)
+        ]
+    def segment_control_net(self, index, lower=0, upper=1):
+        net = tuple(
+            zip(
+                *(
+                    self.bernstein_coefficients(i) 
+                    for i in self.segment_polynomials(index)
+                )
+            )
+        )
+        net = self.subdivide_control_net(net, lower)[1] if lower > 0 else net
+        return self.subdivide_control_net(
+            net, (upper - lower) / (1 - lower)
+        )[0] if upper < 1 else net
+    def set_segment_control_net(self, index, net):
+        return self.set_segment(index, self.control_net_coefficients(net))
+    def segment_bounds(self, index, lower=0, upper=1):
+        return self.polynomial_bounds(
+            self.segment_polynomials(index), lower, upper
+        )
+    def segment_function(self, index):
+        return lambda t: self.segment_output(index, t)
+    def segment_output(self, index, t):
+        parameters = self.parameters
+        coefficients = self._coefficients
+        start = (index % self.size) * self.stride
+        outputs = []
+        for i in range(start, start + self.stride, parameters):
+            output = 0
+            for coefficient in reversed(coefficients[i : i + parameters]):
+                output = output * t + coefficient
+            outputs.append(output)
+        return tuple(outputs)
+
+    def segment_output_derivatives(self, index, t):
+        parameters = self.tabulated_argument().parameters
+        coefficients = self._coefficients
+        start = (index % self.size) * self.stride
+        outputs = ([], [], [])
+        for i in range(start, start + self.stride, parameters):
+            position = velocity = acceleration = 0
+            for coefficient in reversed(coefficients[i : i + parameters]):
+                acceleration = acceleration * t + velocity
+                velocity = velocity * t + position
+                position = position * t + coefficient
+            outputs[0].append(position)
+            outputs[1].append(velocity)
+            outputs[2].append(2 * acceleration)
+        return outputs
+    def segment_closest_input(self, index, point, t=0.5, tolerance=1e-12, 
+                              iterations=16):
+        for i in range(iterations):
+            position, velocity, acceleration = \
+                self.segment_output_derivatives(index, t)
+            offset = [j - k for j, k in zip(position, point)]
+            gradient = sum(map(mul, offset, velocity))
+            curvature = sum(map(mul, velocity, velocity)) \
+                + sum(map(mul, offset, acceleration))
+            step = gradient / curvature if curvature > 0 \
+                else gradient / max(sum(map(mul, velocity, velocity)), 1e-12)
+            step = min(max(t - step, 0), 1) - t
+            t += step
+            if abs(step) <= tolerance:
+                break
+        return t
+
+    def function_index(self, t): 
+        return min(
+            max(int(t // 1), 0), self.size - 1
+        )
+    def function_input(self, t): return t - self.function_index(t)
 
     def output(self, t):
-         return self.input_function(t)(
-             self.function_input(t)
-         )
-    def outputs(self, lower=None, upper=None, resolution=None):
-        lower, upper, resolution = lower.indices(self.size) \
+        index = self.function_index(t)
+        return self.segment_output(index, t - index) if self.tabulated \
+            else self.function(index)(t - index)
+    def inputs(self, lower=None, upper=None, resolution=None):
+        lower, upper, resolution = (lower.start, lower.stop, lower.step) \
             if isinstance(lower, slice) else (lower, upper, resolution)
         lower = 0 if lower is None else lower
         upper = self.size if upper is None else upper
         resolution = 0.1 if resolution is None else resolution
         return (
-            self.call(i) for i in range(lower, upper, resolution)
+            lower + i * resolution 
+            for i in range(ceil((upper - lower) / resolution))
+        )
+    def outputs(self, lower=None, upper=None, resolution=None):
+        return (
+            self.output(i) for i in self.inputs(lower, upper, resolution)
+        )
+
+    def segment_buckets(self, ts):
+        last = self.size - 1
+        indices = [min(max(int(t // 1), 0), last) for t in ts]
+        if all(map(le, indices, indices[1:])):
+            start = 0
+            for i in range(1, len(indices) + 1):
+                if i == len(indices) or indices[i] != indices[start]:
+                    yield indices[start], range(start, i)
+                    start = i
+        else:
+            buckets = {}
+            [
+                buckets.setdefault(v, []).append(i) 
+                for i, v in enumerate(indices)
+            ]
+            yield from buckets.items()
+    def evaluate_many(self, ts, buckets=None):
+        ts = ts if isinstance(ts, Sequence) else list(ts)
+        dimension = self._dimension
+        if not self.tabulated:
+            outputs = array("d")
+            [outputs.extend(self.output(t)) for t in ts]
+            return Tensor(
+                dimension, height=len(ts), elements=outputs, link=True
+            )
+
+        parameters = self.parameters
+        outputs = array("d", bytes(8 * dimension * len(ts)))
+        buckets = self.segment_buckets(ts) if buckets is None else buckets
+        for index, positions in buckets:
+            segment = self._coefficients[self.segment_slice(index)]
+            coefficient_sets = [
+                segment[i : i + parameters][::-1]
+                for i in range(0, self.stride, parameters)
+            ]
+            for j, coefficients in enumerate(coefficient_sets):
+                for position in positions:
+                    t = ts[position] - index
+                    output = 0
+                    for coefficient in coefficients:
+                        output = output * t + coefficient
+                    outputs[position * dimension + j] = output
+        return Tensor(
+            dimension, height=len(ts), elements=outputs, link=True
+        )
+    
+    def evaluate_with_derivatives(self, ts, buckets=None):
+        ts = ts if isinstance(ts, Sequence) else list(ts)
+        dimension = self.tabulated_argument()._dimension
+        parameters = self.parameters
+        outputs = [
+            array("d", bytes(8 * dimension * len(ts))) for i in range(3)
+        ]
+        positions, velocities, accelerations = outputs
+        buckets = self.segment_buckets(ts) if buckets is None else buckets
+        for index, indices in buckets:
+            segment = self._coefficients[self.segment_slice(index)]
+            coefficient_sets = [
+                segment[i : i + parameters][::-1]
+                for i in range(0, self.stride, parameters)
+            ]
+            for j, coefficients in enumerate(coefficient_sets):
+                for i in indices:
+                    t = ts[i] - index
+                    position = velocity = acceleration = 0
+                    for coefficient in coefficients:
+                        acceleration = acceleration * t + velocity
+                        velocity = velocity * t + position
+                        position = position * t + coefficient
+                    positions[i * dimension + j] = position
+                    velocities[i * dimension + j] = velocity
+                    accelerations[i * dimension + j] = 2 * acceleration
+        return tuple(
+            Tensor(dimension, height=len(ts), elements=i, link=True)
+            for i in outputs
+        )
+
+    def derivative(self, order=1):
+        self.tabulated_argument()
+        parameters = self.parameters
+        degree = max(self._degree - order, 0)
+        coefficients = array("d")
+        for i in range(0, len(self._coefficients), parameters):
+            polynomial = list(self._coefficients[i : i + parameters])
+            for j in range(order):
+                polynomial = [
+                    k * v for k, v in enumerate(polynomial)
+                ][1:]
+            coefficients.extend(
+                (polynomial + [0] * (degree + 1))[:degree + 1]
+            )
+        return self.__class__(
+            coefficients=coefficients, dimension=self._dimension, 
+            degree=degree
         )
     
+    def segment_speed(self, index, t):
+        return sum(
+            i**2 for i in self.velocity.segment_output(index, t)
+        )**0.5
+    def speed(self, t):
+        index = self.function_index(t)
+        return self.segment_speed(index, t - index)
+    def gauss_legendre_length(self, index, lower, upper):
+        width = upper - lower
+        return width * sum(
+            weight * self.segment_speed(index, lower + width * node)
+            for node, weight in GAUSS_LEGENDRE
+        )
+    def segment_arc_length(self, index, lower=0, upper=1, tolerance=1e-9, 
+                           depth=24):
+        length = 0
+        stack = [
+            (lower, upper, self.gauss_legendre_length(index, lower, upper), 
+             tolerance, 0)
+        ]
+        while stack:
+            lower, upper, estimate, tolerance, level = stack.pop()
+            middle = (lower + upper) / 2
+            leading = self.gauss_legendre_length(index, lower, middle)
+            trailing = self.gauss_legendre_length(index, middle, upper)
+            if abs(leading + trailing - estimate) <= tolerance \
+                    or level >= depth:
+                length += leading + trailing
+            else:
+                stack.append(
+                    (lower, middle, leading, tolerance / 2, level + 1)
+                )
+                stack.append(
+                    (middle, upper, trailing, tolerance / 2, level + 1)
+                )
+        return length
+
+    def arc_length_input(self, s, guess=None, tolerance=1e-9, 
+                         iterations=32):
+        lengths = self.arc_lengths
+        s = min(max(s, 0), lengths[-1])
+        index = min(bisect_right(lengths, s) - 1, self.size - 1)
+        target = s - lengths[index]
+        length = lengths[index + 1] - lengths[index]
+        lower, upper = 0, 1
+        t = guess - index if guess is not None and 0 < guess - index < 1 \
+            else target / length if length > 0 \
+            else 0
+        base = base_length = 0
+        for i in range(iterations):
+            error = base_length + self.segment_arc_length(
+                index, base, t, tolerance=tolerance / 4
+            ) - target
+            if abs(error) <= tolerance:
+                break
+            base, base_length = t, error + target
+            lower, upper = (t, upper) if error < 0 else (lower, t)
+            speed = self.segment_speed(index, t)
+            t = t - error / speed \
+                if speed > 0 and lower < t - error / speed < upper \
+                else (lower + upper) / 2
+        return index + t
+    def arc_length_inputs(self, step, tolerance=1e-9):
+        t = None
+        for i in range(int(self.arc_length // step) + 1):
+            t = self.arc_length_input(i * step, guess=t, tolerance=tolerance)
+            yield t
+    def resample_by_arclength(self, step, tolerance=1e-9):
+        return (
+            self.output(i) for i in self.arc_length_inputs(
+                step, tolerance=tolerance
+            )
+        )
+
+    def chordal_deviation(self, lower, upper, samples=16):
+        index = min(int(lower // 1), self.size - 1)
+        if upper - index <= 1:
+            return self.control_net_flatness(
+                self.segment_control_net(index, lower - index, upper - index)
+            )
+        leading, trailing = self.output(lower), self.output(upper)
+        chord = [j - i for i, j in zip(leading, trailing)]
+        length = sum(i**2 for i in chord)
+        deviation = 0
+        for node in range(1, samples):
+            offset = [
+                j - i for i, j in zip(
+                    leading, 
+                    self.output(lower + (upper - lower) * node / samples)
+                )
+            ]
+            projection = min(
+                max(sum(i * j for i, j in zip(offset, chord)) / length, 0), 1
+            ) if length > 0 else 0
+            deviation = max(
+                deviation,
+                sum(
+                    (i - projection * j)**2 for i, j in zip(offset, chord)
+                )**0.5
+            )
+        return deviation
+    def adaptive_inputs(self, tolerance, lower=None, upper=None, depth=16):
+        lower = 0 if lower is None else lower
+        upper = self.size if upper is None else upper
+        inputs = [lower]
+        bounds = [
+            min(i, upper) for i in range(int(lower // 1) + 1, ceil(upper))
+        ] + [upper]
+        for bound in bounds:
+            intervals = [(bound, 0)]
+            while intervals:
+                end, level = intervals[-1]
+                start = inputs[-1]
+                if level < depth and self.chordal_deviation(start, end) \
+                        > tolerance:
+                    intervals.append(((start + end) / 2, level + 1))
+                else:
+                    inputs.append(end)
+                    intervals.pop()
+        return inputs
+    def subdivision_inputs(self, tolerance, lower=None, upper=None, 
+                           depth=16):
+        lower = 0 if lower is None else lower
+        upper = self.size if upper is None else upper
+        inputs = [lower]
+        bounds = [
+            min(i, upper) for i in range(int(lower // 1) + 1, ceil(upper))
+        ] + [upper]
+        for bound in bounds:
+            start = inputs[-1]
+            index = min(int(start // 1), self.size - 1)
+            intervals = [
+                (
+                    self.segment_control_net(
+                        index, start - index, bound - index
+                    ), 
+                    start, bound, 0
+                )
+            ]
+            while intervals:
+                net, start, end, level = intervals.pop()
+                if level < depth and self.control_net_flatness(net) \
+                        > tolerance:
+                    leading, trailing = self.subdivide_control_net(net)
+                    middle = (start + end) / 2
+                    intervals.append((trailing, middle, end, level + 1))
+                    intervals.append((leading, start, middle, level + 1))
+                else:
+                    inputs.append(end)
+        return inputs
+    def tessellate(self, tolerance, lower=None, upper=None, depth=16, 
+                   subdivision=False):
+        return self.evaluate_many(
+            (self.subdivision_inputs if subdivision else self.adaptive_inputs)(
+                tolerance, lower=lower, upper=upper, depth=depth
+            )
+        )
+
     def __iadd__(self, function):
         self.extend_functions(function) if isinstance(function, Iterable) \
             else self.add_function(function)
@@ -418,7 +1654,8 @@ class InterpolationFunction:
     def __call__(self, *t): 
         return self.output(*t) if not t or (
             len(t) == 1 and isinstance(t[0], Number)
-        ) else self.outputs(t) if isinstance(t, slice) \
+        ) else self.outputs(t[0]) if isinstance(t[0], slice) \
+            else self.evaluate_many(t[0]) if isinstance(t[0], Iterable) \
             else self.output(*t)
     def __getitem__(self, index): 
         return self.outputs(index) if isinstance(index, slice) \
@@ -0,0 +1,243 @@
+from math import cos, dist, sin
+from pickle import dumps, loads
+
+from pytest import raises
+
+from spline import (
+    ControlArm, ControlPoint, ControlPointSet, CubicSplineInterpolationCurve, 
+    InterpolationFunction, StreamingCubicSplineBuilder
+)
+from vector import Vector
+
+
+def test_reversed_arm_arithmetic():
+    arm = ControlArm([1, 2, 3], direction=-1)
+    vector = Vector([1, 1, 1])
+    assert list(arm.elements) == [-1, -2, -3]
+    assert list((arm + vector).elements) == [0, -1, -2]
+    assert list((vector + arm).elements) == [0, -1, -2]
+    assert list((arm - vector).elements) == [-2, -3, -4]
+    assert list(arm.scale(2).elements) == [-2, -4, -6]
+    assert arm.dot(vector) == vector.dot(arm) == -6
+    assert arm.copy().direction == -1
+    assert list(arm.copy().elements) == [-1, -2, -3]
+
+
+def test_arm_direction_flip():
+    arm = ControlArm([1, 2, 3], direction=-1)
+    arm[0] = 4
+    assert arm[0] == 4
+    arm.direction = 1
+    assert list(arm.elements) == [-4, 2, 3]
+    assert list(ControlArm(arm).elements) == [-4, 2, 3]
+
+
+def test_incremental_refit_matches_full_fit():
+    amplitude = 1e6
+    points = [
+        ControlPoint(i * amplitude / 10, amplitude * sin(i * 0.7)) 
+        for i in range(300)
+    ]
+    curve = CubicSplineInterpolationCurve(points, incremental=True)
+    curve.function
+    curve.set_point(150, ControlPoint(15 * amplitude, 3 * amplitude))
+    function = curve.function
+    expected = CubicSplineInterpolationCurve(list(curve.points)).function
+    assert max(
+        abs(i - j)
+        for k in range(2990) 
+        for i, j in zip(function.output(k / 10), expected.output(k / 10))
+    ) <= curve.tolerance
+
+
+def test_control_point_set_points_are_read_only():
+    points = ControlPointSet(
+        [
+            ControlPoint(1, 2, leading=(1, 0), continuous=True), 
+            ControlPoint(3, 4)
+        ]
+    )
+    point = points[0]
+    assert point.continuous and points.continuous(0)
+    assert list(point.trailing_arm.elements) == [-1, 0]
+    with raises(TypeError):
+        point[0] = 5
+    with raises(TypeError):
+        point += point
+    with raises(TypeError):
+        point.leading_arm[0] = 3
+    with raises(TypeError):
+        point.set_leading_arm((1, 1))
+    copy = point.copy()
+    copy[0] = 7
+    assert list(copy.elements) == [7, 2]
+    assert list(points.position(0)) == [1, 2]
+    points[0] = copy
+    assert list(points.position(0)) == [7, 2]
+
+
+def test_control_point_set_from_no_positions():
+    assert ControlPointSet.from_positions([]).size == 0
+    assert ControlPointSet.from_positions([], dimension=2).dimension == 2
+
+
+def test_streamed_segments_match_global_fit():
+    amplitude = 1e3
+    positions = [
+        (i * amplitude / 10, amplitude * sin(i * 0.7)) for i in range(200)
+    ]
+    builder = StreamingCubicSplineBuilder()
+    function = builder.function(positions)
+    expected = CubicSplineInterpolationCurve(
+        [ControlPoint(*i) for i in positions]
+    ).function
+    assert function.size == expected.size == 199
+    assert max(
+        abs(i - j)
+        for k in range(1990) 
+        for i, j in zip(function.output(k / 10), expected.output(k / 10))
+    ) <= builder.tolerance
+
+
+def test_tessellation_meets_tolerance():
+    function = CubicSplineInterpolationCurve(
+        [ControlPoint(i, (-1)**i * (i % 3)) for i in range(30)]
+    ).function
+    tolerance = 1e-3
+    inputs = function.adaptive_inputs(tolerance)
+    for lower, upper in zip(inputs[:-1], inputs[1:]):
+        leading, trailing = function.output(lower), function.output(upper)
+        chord = [j - i for i, j in zip(leading, trailing)]
+        length = sum(i**2 for i in chord)
+        for k in range(1, 64):
+            point = function.output(lower + (upper - lower) * k / 64)
+            offset = [j - i for i, j in zip(leading, point)]
+            projection = min(
+                max(sum(i * j for i, j in zip(offset, chord)) / length, 0), 1
+            ) if length > 0 else 0
+            assert dist(
+                point, [i + projection * j for i, j in zip(leading, chord)]
+            ) <= tolerance
+
+
+def test_arc_length_parameterisation_on_a_line():
+    function = CubicSplineInterpolationCurve(
+        [ControlPoint(i, 0.5 * i) for i in (0, 1, 5, 6)]
+    ).function
+    length = 6 * 1.25**0.5
+    assert abs(function.arc_length - length) <= 1e-9
+    assert abs(function.arc_lengths[2] - 5 * 1.25**0.5) <= 1e-9
+    step = length / 24
+    t = function.arc_length_input(7 * step)
+    assert abs(function.output(t)[0] - 7 / 4) <= 1e-9
+    points = list(function.resample_by_arclength(step))
+    assert len(points) == 25
+    assert all(
+        abs(dist(i, j) - step) <= 1e-9 for i, j in zip(points[:-1], points[1:])
+    )
+
+
+def test_derivatives_match_per_dimension_dense_solves():
+    points = [ControlPoint(i, sin(i), cos(2 * i)) for i in range(8)]
+    for points in (points, points + [points[0].copy()]):
+        curve = CubicSplineInterpolationCurve(points)
+        derivatives = curve.derivatives()
+        coefficients = curve.coefficients.to_matrix()
+        assert (derivatives.width, derivatives.height) == (3, 8)
+        for i in range(3):
+            expected = coefficients.solve(curve.resultants(i))
+            assert all(
+                abs(j - k) <= 1e-12 
+                for j, k in zip(derivatives.column(i), expected.elements)
+            )
+
+
+def test_packed_coefficient_table():
+    segments = [[(1, 2, 3), (0, 1)], [(6, 8, 3), (1, 1)]]
+    function = InterpolationFunction.from_segments(segments)
+    adapter = InterpolationFunction(
+        [InterpolationFunction.polynomial_array(i) for i in segments]
+    )
+    assert function.tabulated and not adapter.tabulated
+    assert (function.size, function.dimension, function.degree) == (2, 2, 2)
+    assert function.segment(1) == ((6, 8, 3), (1, 1, 0))
+    for t in (0, 0.5, 1.5, 2):
+        assert function.output(t) == adapter.output(t)
+    assert loads(dumps(function)).output(1.5) == (10.75, 1.5)
+    function.set_segment(1, [(0,), (0,)])
+    assert function.has_segment([(0,), (0,)])
+    assert function.output(1.5) == (0, 0)
+    assert function.output(0.5) == (2.75, 0.5)
+
+
+def test_evaluate_many_matches_output():
+    function = CubicSplineInterpolationCurve(
+        [ControlPoint(i, sin(i), cos(i)) for i in range(12)]
+    ).function
+    adapter = InterpolationFunction(function.functions, dimension=3)
+    ordered = [i / 7 for i in range(-7, 85)]
+    shuffled = ordered[1::2] + ordered[::2]
+    for ts in (ordered, shuffled):
+        for outputs in (
+            function.evaluate_many(iter(ts)), adapter.evaluate_many(ts)
+        ):
+            assert (outputs.width, outputs.height) == (3, len(ts))
+            assert all(
+                abs(j - k) <= 1e-12 
+                for t, i in zip(ts, outputs.row_buffers())
+                for j, k in zip(i, function.output(t))
+            )
+    assert function.evaluate_many([]).height == 0
+
+
+def test_analytic_derivatives():
+    function = InterpolationFunction.from_segments(
+        [[(1, 2, 3, 4), (0, 1)], [(10, 20, 15, 4), (1, 1)]]
+    )
+    velocity, acceleration, jerk = (function.derivative(i) for i in (1, 2, 3))
+    assert function.velocity.segment(0) == ((2, 6, 12), (1, 0, 0))
+    assert velocity.degree == 2 and jerk.degree == 0
+    assert jerk.segment(1) == ((24,), (0,))
+    ts = [0.25, 1.5, 0.75]
+    outputs = function.evaluate_with_derivatives(ts)
+    for expected, output in zip((function, velocity, acceleration), outputs):
+        assert list(output.elements) == [
+            j for i in ts for j in expected.output(i)
+        ]
+    assert list(outputs[1].row(1)) == [20 + 30 * 0.5 + 12 * 0.25, 1]
+    assert list(outputs[2].row(0)) == [6 + 24 * 0.25, 0]
+
+
+def test_control_net_conversion_and_subdivision():
+    coefficients = [1, -2, 3, 0.5]
+    assert all(
+        abs(i - j) <= 1e-12 
+        for i, j in zip(
+            InterpolationFunction.power_coefficients(
+                InterpolationFunction.bernstein_coefficients(coefficients)
+            ), 
+            coefficients
+        )
+    )
+    function = InterpolationFunction.from_segments(
+        [[(1, 2, 3, 4), (0, 1, -1, 2)]]
+    )
+    net = function.segment_control_net(0)
+    assert net[0] == function.output(0) and net[-1] == function.output(1)
+    leading, trailing = InterpolationFunction.subdivide_control_net(net)
+    assert leading == function.segment_control_net(0, 0, 0.5)
+    assert trailing == function.segment_control_net(0, 0.5, 1)
+    assert leading[-1] == trailing[0] == function.output(0.5)
+    middle = InterpolationFunction.from_control_nets(
+        [function.segment_control_net(0, 0.25, 0.75)]
+    )
+    assert all(
+        abs(j - k) <= 1e-12 
+        for i in range(11) 
+        for j, k in zip(
+            middle.output(i / 10), function.output(0.25 + i / 20)
+        )
+    )
+    assert InterpolationFunction.control_net_flatness(
+        [(0, 0), (1, 1), (2, 2), (3, 3)]
+    ) == 0
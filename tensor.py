@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
+from array import array
 from collections.abc import Iterable, Sized, Sequence
+from itertools import repeat
 from numbers import Number
 from math import prod
+from operator import add, mul, sub
+
+
+STORAGE_TYPES = {
+    "list": list,
+    "array": array,
+}
 
 
 class TensorType(ABC):  
@@ -259,6 +268,20 @@ class TensorType(ABC):
         ]
         return self
 
+    def row_buffers(self): return [list(i) for i in self.rows]
+    def column_buffers(self): return [list(i) for i in self.columns]
+
+    def dot_elements(self, other):
+        elements = []
+        for i, row in enumerate(self.rows):
+            for j, column in enumerate(other.columns):
+                elements.append(
+                    sum(
+                        i * j for i, j in zip(row, column)
+                    )
+                )
+        return elements
+
     def equivalent(self, other): 
         return tuple(self.elements) == tuple(other.elements) \
             and self._shape == other._shape
@@ -289,7 +312,8 @@ class TensorType(ABC):
         self.set_element(element, *address) if isinstance(address, Iterable) \
             else self.set_index(address, element)
     def __neg__(self): return self.scale(-1)
-    def __eq__(self, other): return self.equivalent(other)
+    def __eq__(self, other): 
+        return isinstance(other, TensorType) and self.equivalent(other)
     def __add__(self, other): return self.add(other)
     def __iadd__(self, other): return self.iadd(other)
     def __sub__(self, other): return self.subtract(other)
@@ -311,129 +335,243 @@ class TensorType(ABC):
     
 
 class TensorReference(TensorType):
-    def __init__(self, tensor, column, row, width, height):
-        self._tensor = tensor
-        self._address = [column, row]
+    def __init__(self, tensor, column, row, width, height, strides=None):
+        root = tensor._tensor if isinstance(tensor, TensorReference) \
+            else tensor
+        column_stride, row_stride = (1, tensor.width) if strides is None \
+            else strides
+        self._tensor = root
+        self._offset = tensor.tensor_index(tensor.index(column, row)) \
+            if isinstance(tensor, TensorReference) \
+            else tensor.index(column, row)
+        self._strides = (
+            column_stride, row_stride
+        ) if not isinstance(tensor, TensorReference) else (
+            tensor.tensor_stride(column_stride), 
+            tensor.tensor_stride(row_stride)
+        )
         super().__init__(width, height)
 
     @property
-    def reference_column(self): return self._address[0]
+    def reference_column(self): return self.reference_address[0]
     @property
-    def reference_row(self): return self._address[1]
+    def reference_row(self): return self.reference_address[1]
     @property
-    def reference_address(self): return tuple(self._address)
+    def reference_address(self): return self._tensor.address(self._offset)
     @property
-    def reference_index(self): return self._tensor.index(*self._address)
+    def reference_index(self): return self._offset
     @property
     def tensor(self): return self._tensor
+    @property
+    def offset(self): return self._offset
+    @property
+    def strides(self): return self._strides
+    @property
+    def contiguous(self):
+        return self.height == 1 or self._strides[1] == \
+            self._strides[0] * self.width
+    @property
+    def elements(self):
+        elements = self._tensor._elements
+        return iter(elements[self.element_slices()[0]]) if self.contiguous \
+            else (j for i in self.element_slices() for j in elements[i])
+    @property
+    def storage(self): return self._tensor.storage
+    @property
+    def transpose(self): 
+        return self.__class__(
+            self, 0, 0, self.height, self.width, strides=(self.width, 1)
+        )
 
     def get_index(self, index): 
-        return self._tensor.get_index(
-            self.tensor_index(index)
-        )
+        index %= self.size
+        return self._tensor._elements[
+            self._offset + index % self.width * self._strides[0] 
+            + index // self.width * self._strides[1]
+        ]
     def set_index(self, index, element):
-        self._tensor.set_index(
-            self.tensor_index(index), element
+        index %= self.size
+        self._tensor._elements[
+            self._offset + index % self.width * self._strides[0] 
+            + index // self.width * self._strides[1]
+        ] = element
+        self._tensor.modified()
+        return self
+    def set_elements(self, elements):
+        elements = list(
+            elements.elements if isinstance(elements, TensorType) 
+            else elements
         )
+        start = 0
+        for i in self.element_slices():
+            count = len(range(i.start, i.stop, i.step))
+            if start + count > len(elements):
+                break
+            self._tensor._elements[i] = self._tensor.buffer(
+                elements[start : start + count]
+            )
+            start += count
+        self._tensor.modified()
+        [
+            self.set_index(start + i, v) 
+            for i, v in enumerate(elements[start : self.size])
+        ]
         return self
     def set_address(self, column, row):
-        self._address[0] = column
-        self._address[1] = row
+        self._offset = self._tensor.index(column, row)
         return self
     
     def lower_address(self, step=1):
-        self._address[0] += step
-        return self
+        return self.set_address(
+            self.reference_column + step, self.reference_row
+        )
     def raise_address(self, step=1):
         return self.lower_address(step=-step)
     def shift_address(self, step=1):
-        self._address[1] += step
-        return self
+        return self.set_address(
+            self.reference_column, self.reference_row + step
+        )
+
+    def element_slices(self):
+        column_stride, row_stride = self._strides
+        return [
+            slice(
+                self._offset, 
+                self._offset + (self.size - 1) * column_stride + 1, 
+                column_stride
+            )
+        ] if self.contiguous else [
+            slice(
+                self._offset, 
+                self._offset + (self.height - 1) * row_stride + 1, 
+                row_stride
+            )
+        ] if self.width == 1 else [
+            slice(
+                self._offset + i * row_stride, 
+                self._offset + i * row_stride 
+                    + (self.width - 1) * column_stride + 1, 
+                column_stride
+            )
+            for i in range(self.height)
+        ]
+    def row_buffers(self):
+        elements = self._tensor._elements
+        column_stride, row_stride = self._strides
+        return [
+            elements[
+                self._offset + i * row_stride 
+                : self._offset + i * row_stride 
+                    + (self.width - 1) * column_stride + 1
+                : column_stride
+            ]
+            for i in range(self.height)
+        ]
+    def column_buffers(self):
+        elements = self._tensor._elements
+        column_stride, row_stride = self._strides
+        return [
+            elements[
+                self._offset + i * column_stride
+                : self._offset + i * column_stride 
+                    + (self.height - 1) * row_stride + 1
+                : row_stride
+            ]
+            for i in range(self.width)
+        ]
 
+    def tensor_stride(self, stride):
+        return stride % self.width * self._strides[0] \
+            + stride // self.width * self._strides[1]
     def reference_index_address(self, index):
-        return self.tensor_address(
-            *self.address(index)    
+        return self._tensor.address(
+            self.tensor_index(index)
         )
     def reference_address_index(self, column, row):
         return self.tensor_index(
             self.index(column, row)
         )
     def tensor_address(self, column, row):
-        return (
-            column % self.width + self.reference_column, 
-            row % self.height + self.reference_row
+        return self._tensor.address(
+            self.reference_address_index(column, row)
         )
     def tensor_index(self, index):
-         return self._tensor.index(
-            *self.reference_index_address(index % self.size)
-        )
+        index %= self.size
+        return self._offset + index % self.width * self._strides[0] \
+            + index // self.width * self._strides[1]
     
     def tensor_indices(self, column=None, row=None, width=None, height=None):
-        return self._tensor.sub_tensor_indices(    
-            column=self.reference_column if column is None else column % self.width,
-            row=self.reference_row if row is None else row % self.height,
-            width=self.width if width is None else width,
-            height=self.height if height is None else height
+        column = 0 if column is None else column % self.width
+        row = 0 if row is None else row % self.height
+        width = self.width - column if width is None else width
+        height = self.height - row if height is None else height
+        return iter(
+            [
+                self.tensor_index(self.index(column + i, row + j))
+                for j in range(height) for i in range(width)
+            ]
         )
 
+    def view(self, column, row, width, height, strides=None):
+        return TensorReference(
+            self, column, row, width, height, strides=strides
+        )
+    def row_reference(self, row):
+        return self.view(0, row, self.width, 1)
+    def column_reference(self, column):
+        return self.view(column, 0, 1, self.height)
+
+    def add(self, other, *args, **kwargs): 
+        return self.to_tensor(type=Tensor).iadd(other)
+    def scale(self, scalar, *args, **kwargs):
+        return self.to_tensor(type=Tensor).iscale(scalar)
+    def idot(self, other): return Tensor.idot(self, other)
+    def new_tensor(self, width, height=None, elements=None, **kwargs):
+        kwargs.setdefault("storage", self._tensor.storage)
+        return Tensor.new_tensor(
+            width, height=height, elements=elements, **kwargs
+        )
+    def dot_elements(self, other): return Tensor.dot_elements(self, other)
     def dot(self, other, *args, type=None, **kwargs):
         type = Tensor if type is None else type
         return type.dot(self, other, *args, **kwargs)
 
     def copy(self):
-        return self.new(self._tensor, *self.reference_address, *self.shape)
+        return self.__class__(
+            self._tensor, *self.reference_address, *self.shape, 
+            strides=self._strides
+        )
 
     def to_tensor(self, *args, type=None, **kwargs):
-        type = self._tensor.__class__ if type is None else type
+        type = Tensor if type is None else type
+        kwargs.setdefault("storage", self._tensor.storage)
         return type.new_tensor(
             self.width, *args, height=self.height, elements=self.elements, **kwargs 
             )
 
+    def __mul__(self, other):
+        return self.scale(other) if isinstance(other, Number) \
+            else self.scale(other.get_index(0)) \
+                if other.size == 1 else self.dot(other)
+    def __imul__(self, other):
+        return self.iscale(other) if isinstance(other, Number) \
+            else self.iscale(other.get_index(0)) \
+                if other.size == 1 else self.idot(other)
+
 
 class Tensor(TensorType):
-    @classmethod
-    def _row_echelon_recursion(cls, tensor):
-        if tensor.width > 1:
-            indices = [
-                i for i, v in enumerate(
-                    tensor.column(0)
-                ) if v != 0
-            ]
-            if len(indices) > 1:
-                equation = list(
-                    tensor.row(indices[0])
-                )
-                for i in indices[1:]:
-                    coefficient = tensor.element(0, i) / equation[0]
-                    tensor.set_row(
-                        i, (
-                            v - equation[j] * coefficient \
-                            for j, v in enumerate(
-                                tensor.row(i)
-                            )
-                        )
-                    )
-            tensor.set_sub_tensor(
-                1, 1, cls._row_echelon_recursion(
-                    tensor.sub_tensor(
-                        1, 1, tensor.width - 1, tensor.height - 1
-                    )
-                )
-            )
-            tensor.move_row(indices[0], 0)
-            return tensor
-        else:
-            return tensor
-    
+    _link = None
+
     @classmethod
     def new_tensor(cls, width, height=None, elements=None, fill=None, 
-                   link=False):
+                   link=False, storage=None):
         return cls(
             width, 
             height=height, 
             elements=elements, 
             fill=fill, 
-            link=link
+            link=link,
+            storage=storage
         )
     @classmethod
     def from_tensor(cls, tensor, **kwargs):
@@ -478,68 +616,181 @@ class Tensor(TensorType):
         kwargs.update(height=height, elements=[], fill=fill)
         return cls.new(width, **kwargs)
 
-    def __init__(self, width, height=None, elements=None, fill=None, link=False):
-        self._elements = elements if isinstance(elements, list) and link \
+    def __init__(self, width, height=None, elements=None, fill=None, link=False,
+                 storage=None):
+        storage = storage if storage is not None \
+            else elements._storage if isinstance(elements, Tensor) and link \
+            else "array" if isinstance(elements, array) and link \
+            else "list"
+        if storage not in STORAGE_TYPES:
+            raise ValueError(f"Unknown tensor storage '{storage}'")
+        self._storage = storage
+        source = elements if isinstance(elements, Tensor) and link else None
+
+        elements = elements if isinstance(elements, (list, array)) and link \
             else elements._elements if isinstance(elements, Tensor) and link \
             else list(elements.elements) if isinstance(elements, TensorType) \
             else list(elements) if isinstance(elements, Iterable) \
             else [elements] if elements is not None \
             else []
         
-        element_size = len(self._elements)
+        element_size = len(elements)
         height = height if height is not None \
             else element_size // width + (element_size % width) // 1
         super().__init__(width, height)
         
         fill = 0 if fill is None else fill
-        temp = self._elements.copy()
-        temp.extend([fill] * self.size)
-        self._elements.clear()
-        self._elements.extend(temp[:self.size])
+        elements.extend([fill] * (self.size - element_size)) \
+            if element_size < self.size else None
+        del elements[self.size:]
+        self._elements = elements \
+            if isinstance(elements, STORAGE_TYPES[storage]) \
+            else self.buffer(elements)
+        self._version = 0
+        if source is not None:
+            source._link = self._link = source._link \
+                if source._link is not None else [source._version]
 
     @property
     def is_empty(self): return set(self._elements) == {0}
     @property
     def elements(self): return iter(self._elements)
     @property
-    def transpose(self):
-        return self.from_rows(self.columns)
+    def storage(self): return self._storage
     @property
-    def row_echelon(self): 
-        return self._row_echelon_recursion(
-            self.copy()
-        )
+    def version(self): 
+        return self._version if self._link is None else self._link[0]
+    @property
+    def transpose(self): return self.transpose_reference()
+    @property
+    def row_echelon(self): return self.copy().irow_echelon()
     ref = row_echelon
     @property
-    def adjoint(self):
-        return self.new_tensor(
-            self.width,
-            height=self.height,
-            elements=[
-                self.cofactor(
-                    *self.address(i)
-                ).determinant * (-1)**sum(
-                    self.address(i)
-                )
-                for i in range(self.size)
-            ]
-        ).transpose
+    def reduced_row_echelon(self): 
+        return self.copy().ireduced_row_echelon()
+    rref = reduced_row_echelon
+    @property
+    def pivots(self): return self.copy()._eliminate()
+    @property
+    def rank(self): return len(self.pivots)
+    @property
+    def null_space(self):
+        reduced = self.copy()
+        pivots = reduced._eliminate(reduced=True)
+        elements, width = reduced._elements, self.width
+        free = [i for i in range(width) if i not in pivots]
+        basis = [0] * (width * len(free))
+        for j, column in enumerate(free):
+            basis[column * len(free) + j] = 1
+            for i, pivot in enumerate(pivots):
+                basis[pivot * len(free) + j] = -elements[i * width + column]
+        return Tensor.new_tensor(
+            len(free), height=width, elements=basis, storage=self._storage
+        )
+    @property
+    def adjoint(self): return self.lu.adjoint
     
     def get_index(self, index):
         return self._elements[index % self.size]
     def set_index(self, index, element):
         self._elements[index % self.size] = element
-        return self
+        return self.modified()
 
     def set_elements(self, elements):
-        elements = list(elements) if not isinstance(elements, Sequence) \
+        elements = elements._elements if isinstance(elements, Tensor) \
+            else list(elements.elements) if isinstance(elements, TensorType) \
+            else list(elements) if not isinstance(elements, Sequence) \
             else elements
-        temp = self._elements.copy()
-        self._elements.clear()
-        self._elements.extend(
-            elements[:self.size] + temp[len(elements):]
-        )
+        size = min(len(elements), self.size)
+        self._elements[:size] = elements[:size] \
+            if isinstance(elements, STORAGE_TYPES[self._storage]) \
+            else self.buffer(elements[:size])
+        return self.modified()
+
+    def modified(self):
+        if self._link is None:
+            self._version += 1
+        else:
+            self._link[0] += 1
+        return self
+    def cached(self, key, generate):
+        cache = self.__dict__.get("_cache")
+        cache = self.__dict__.setdefault("_cache", {}) if cache is None \
+            else cache
+        version, value = cache.get(key, (None, None))
+        if version != self.version:
+            value = generate()
+            cache[key] = (self.version, value)
+        return value.copy() if isinstance(value, TensorType) \
+            else value[:] if isinstance(value, (list, array)) \
+            else value
+
+    def _eliminate(self, reduced=False, tolerance=1e-12):
+        elements, width, height = self._elements, self.width, self.height
+        tolerance *= max(map(abs, elements), default=0)
+        pivots = []
+        for column in range(width):
+            row = len(pivots)
+            if row == height:
+                break
+            pivot = max(
+                range(row, height), 
+                key=lambda i: abs(elements[i * width + column])
+            )
+            if abs(elements[pivot * width + column]) <= tolerance:
+                continue
+            if pivot != row:
+                elements[row * width : (row + 1) * width], \
+                    elements[pivot * width : (pivot + 1) * width] = \
+                    elements[pivot * width : (pivot + 1) * width], \
+                    elements[row * width : (row + 1) * width]
+            start = row * width + column
+            if reduced:
+                elements[start : (row + 1) * width] = self.buffer(
+                    map(
+                        mul, 
+                        elements[start : (row + 1) * width], 
+                        repeat(1 / elements[start])
+                    )
+                )
+            equation = elements[start : (row + 1) * width]
+            for i in range(0 if reduced else row + 1, height):
+                factor = elements[i * width + column] / equation[0]
+                if i == row or factor == 0:
+                    continue
+                elements[i * width + column : (i + 1) * width] = self.buffer(
+                    map(
+                        sub, 
+                        elements[i * width + column : (i + 1) * width], 
+                        map(mul, equation, repeat(factor))
+                    )
+                )
+                elements[i * width + column] = 0
+            pivots.append(column)
+        self.modified()
+        return pivots
+    def irow_echelon(self):
+        self._eliminate()
         return self
+    def ireduced_row_echelon(self):
+        self._eliminate(reduced=True)
+        return self
+
+    def itranspose(self):
+        if self.width != self.height:
+            raise ValueError("In-place transpose requires a square tensor")
+        elements, width = self._elements, self.width
+        for i in range(width):
+            for j in range(i + 1, width):
+                elements[i * width + j], elements[j * width + i] = \
+                    elements[j * width + i], elements[i * width + j]
+        return self.modified()
+
+    def buffer(self, elements=()):
+        return array("d", elements) if self._storage == "array" \
+            else list(elements)
+    def to_storage(self, storage):
+        return self.copy(storage=storage)
 
     def slice_elements(self, start, stop, step):
         return self._elements[start : stop : step]
@@ -573,23 +824,58 @@ class Tensor(TensorType):
             ), 
             *self.sub_tensor_shape(column, row, width, height)
         )
+    def transpose_reference(self):
+        return TensorReference(
+            self, 0, 0, self.height, self.width, strides=(self.width, 1)
+        )
+    def view(self, column, row, width, height, strides=None):
+        return TensorReference(
+            self, column, row, width, height, strides=strides
+        )
+
+    def row_buffers(self):
+        return [
+            self._elements[i : i + self.width] 
+            for i in range(0, self.size, self.width)
+        ]
+    def column_buffers(self):
+        return [
+            self._elements[i : self.size : self.width] 
+            for i in range(self.width)
+        ]
+
+    def iadd(self, other):
+        other = repeat(other) if isinstance(other, Number) \
+            else other._elements if isinstance(other, Tensor) \
+            else other.elements
+        elements = self.buffer(
+            map(add, self._elements, other)
+        )
+        self._elements[:len(elements)] = elements
+        return self.modified()
+    def iscale(self, other):
+        self._elements[:] = self.buffer(
+            map(mul, self._elements, repeat(other))
+        )
+        return self.modified()
 
     def dot_elements(self, other):
-        elements = []
-        for i, row in enumerate(self.rows):
-            for j, column in enumerate(other.columns):
-                elements.append(
-                    sum(
-                        i * j for i, j in zip(row, column)
-                    )
-                )
-        return elements
+        columns = other.column_buffers()
+        return [
+            sum(
+                map(mul, row, column)
+            )
+            for row in self.row_buffers() for column in columns
+        ]
     
     def dot(self, other):
         elements = self.dot_elements(other)
+        new_tensor = other.new_tensor if self.height == other.height \
+            else Tensor.new_tensor
         return sum(elements) if len(elements) < 2 \
-            else other.new_tensor(
-                other.width, height=other.height, elements=elements
+            else new_tensor(
+                other.width, height=self.height, elements=elements, 
+                storage=other.storage
             )
 
     def idot(self, other):
@@ -603,12 +889,16 @@ class Tensor(TensorType):
         return other
 
     def equivalent(self, other):
-        return self._elements == other._elements \
-            and self._shape == other._shape
+        return self._shape == other._shape and (
+            self._elements == other._elements 
+                if self._storage == other._storage
+            else list(self._elements) == list(other._elements)
+        )
     
     def copy(self, **kwargs):
+        kwargs.setdefault("storage", self._storage)
         return self.new_tensor(
-            *self.shape, elements=self._elements.copy(), **kwargs
+            *self.shape, elements=self._elements[:], link=True, **kwargs
             )
     
     def __getitem__(self, address): 
@@ -0,0 +1,166 @@
+from tensor import Tensor
+from matrix import Matrix, MatrixReference
+from vector import Vector
+
+
+def test_reference_dot_operands():
+    matrix = Matrix(list(range(1, 10)))
+    column = matrix.dot(matrix.column_reference(0))
+    assert column.shape == [1, 3]
+    assert list(column.elements) == [30, 66, 102]
+    row = matrix.row_reference(0).dot(matrix)
+    assert row.shape == [3, 1]
+    assert list(row.elements) == [30, 36, 42]
+    assert matrix.row_reference(1).dot(matrix.column_reference(2)) == 96
+
+
+def test_reference_to_tensor_shape():
+    matrix = Matrix(list(range(1, 10)))
+    column = matrix.column_reference(1).to_tensor()
+    assert column.shape == [1, 3]
+    assert list(column.elements) == [2, 5, 8]
+    assert isinstance(
+        matrix.sub_tensor_reference(0, 0, 2, 2).to_tensor(type=Matrix), 
+        Matrix
+    )
+
+
+def test_transpose_products():
+    matrix = Matrix([1, 2, 3, 4])
+    vector = Vector(1, 1)
+    product = matrix.transpose * vector
+    assert isinstance(product, Vector)
+    assert list(product.elements) == [4, 6]
+    assert vector.transpose * vector == 2
+    assert list((matrix.transpose * matrix).elements) == [10, 14, 14, 20]
+    assert matrix.transpose.determinant == matrix.determinant
+    assert all(
+        abs(i - j) < 1e-12 for i, j in zip(
+            matrix.transpose.inverse.elements, 
+            matrix.inverse.transpose.elements
+        )
+    )
+
+
+def test_transpose_view_writes_through():
+    tensor = Tensor(3, height=2, elements=range(6))
+    transpose = tensor.transpose
+    assert transpose.shape == [2, 3]
+    assert list(transpose.elements) == [0, 3, 1, 4, 2, 5]
+    transpose *= 2
+    assert list(tensor.elements) == [0, 2, 4, 6, 8, 10]
+
+
+def test_matrix_transpose_is_a_view():
+    matrix = Matrix([1, 2, 3, 4])
+    transpose = matrix.transpose
+    assert isinstance(transpose, MatrixReference)
+    assert transpose.tensor is matrix
+    assert transpose.determinant == -2
+    matrix[0, 0] = 5
+    assert list(transpose.elements) == [5, 3, 2, 4]
+    assert transpose.determinant == 14
+    assert all(
+        abs(i - j) < 1e-12 for i, j in zip(
+            transpose.inverse.elements, [4 / 14, -3 / 14, -2 / 14, 5 / 14]
+        )
+    )
+
+
+def test_adjoint_from_lu():
+    assert all(
+        abs(i - j) < 1e-12 for i, j in zip(
+            Matrix([2, 0, 1, 1, 3, 2, 1, 1, 2]).adjoint.elements, 
+            [4, 1, -3, 0, 3, -3, -2, -2, 6]
+        )
+    )
+    assert all(
+        abs(i - j) < 1e-12 for i, j in zip(
+            Matrix([2, 0, 1, 1, 3, 2, 1, 1, 1]).adjoint.elements, 
+            [1, 1, -3, 1, 1, -3, -2, -2, 6]
+        )
+    )
+    assert all(
+        abs(i - j) < 1e-12 for i, j in zip(
+            Matrix(list(range(1, 10))).adjoint.elements, 
+            [-3, 6, -3, 6, -12, 6, -3, 6, -3]
+        )
+    )
+    assert set(Matrix([1] * 9).adjoint.elements) == {0}
+
+
+def test_cached_results_are_copies():
+    matrix = Matrix([4, 7, 2, 6])
+    inverse = matrix.inverse
+    inverse *= 2
+    assert inverse != matrix.inverse
+    vector = Vector(3, 4)
+    unit = vector.unit
+    unit[0] = 0
+    assert vector.unit[0] > 0.59
+
+
+def test_cache_invalidation():
+    matrix = Matrix([1, 2, 3, 4])
+    assert round(matrix.determinant, 9) == -2
+    matrix.set_index(0, 2)
+    assert round(matrix.determinant, 9) == 2
+    matrix.set_elements([1, 0, 0, 1])
+    assert round(matrix.determinant, 9) == 1
+    matrix += Matrix([1, 0, 0, 1])
+    assert round(matrix.determinant, 9) == 4
+    matrix *= 2
+    assert round(matrix.determinant, 9) == 16
+    matrix.row_reference(0).set_index(1, 4)
+    assert round(matrix.determinant, 9) == 16
+    matrix.column_reference(1).set_elements([0, 1])
+    assert round(matrix.determinant, 9) == 4
+
+
+def test_linked_tensors_share_versions():
+    vector = Vector(3, 4)
+    linked = Vector(vector, link=True)
+    assert linked.magnitude == 5
+    vector[0] = 0
+    assert linked.magnitude == 4
+    assert linked.version == vector.version
+    linked *= 2
+    assert vector.magnitude == 8
+
+
+def test_strided_views():
+    tensor = Tensor(4, height=3, elements=range(12))
+    view = tensor.view(0, 0, 2, 3, strides=(2, 4))
+    assert list(view.elements) == [0, 2, 4, 6, 8, 10]
+    assert list(view.transpose.elements) == [0, 4, 8, 2, 6, 10]
+    nested = view.view(1, 1, 1, 2)
+    assert nested.tensor is tensor
+    assert (nested.offset, nested.strides) == (6, (2, 4))
+    assert list(nested.elements) == [6, 10]
+    assert list(tensor.row_reference(1).elements) == [4, 5, 6, 7]
+    assert list(tensor.column_reference(2).elements) == [2, 6, 10]
+    version = tensor.version
+    view.set_elements([-1] * 6)
+    assert tensor.version > version
+    assert list(tensor.elements) == [-1, 1, -1, 3, -1, 5, -1, 7, -1, 9, -1, 11]
+    reference = tensor.sub_tensor_reference(1, 1, 2, 2)
+    assert list(reference.elements) == [5, -1, 9, -1]
+    reference[3] = 12
+    assert tensor.get_index(10) == 12
+
+
+def test_elimination():
+    tensor = Tensor(4, height=3, elements=[1, 2, 3, 4, 2, 4, 6, 8, 0, 1, 1, 2])
+    elements = list(tensor.elements)
+    assert list(tensor.row_echelon.elements) == [
+        2, 4, 6, 8, 0, 1, 1, 2, 0, 0, 0, 0
+    ]
+    assert list(tensor.rref.elements) == [1, 0, 1, 0, 0, 1, 1, 2, 0, 0, 0, 0]
+    assert list(tensor.elements) == elements
+    assert tensor.pivots == [0, 1] and tensor.rank == 2
+    null_space = tensor.null_space
+    assert (null_space.width, null_space.height) == (2, 4)
+    assert list(null_space.elements) == [-1, 0, -1, -2, 1, 0, 0, 1]
+    assert not any(tensor.dot(null_space).elements)
+    assert Tensor(2, height=2).rank == 0
+    assert Tensor(3, height=3, elements=[2, 0, 0, 0, 3, 0, 0, 0, 4]).rank == 3
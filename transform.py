@@ -1,7 +1,11 @@
+from array import array
 from collections.abc import Iterable
+from itertools import combinations, repeat
 from math import cos, sin, radians
-from number import Number
+from operator import add, mul, truediv
 
+from tensor import Tensor, TensorType
+from vector import Vector
 from matrix import Matrix
 
 
@@ -13,7 +17,7 @@ class Transform:
         scalars = (
             list(scalars) + [1] * (dimension - 1)
         )[:dimension - 1]
-        transform = Matrix.empty(dimension)
+        transform = Matrix.identity(dimension)
         for i, v in enumerate(scalars):
             transform.set_index(i * dimension + i, v)
         return transform
@@ -21,20 +25,20 @@ class Transform:
     @classmethod
     def scale_from(cls, *scalars, origin, dimension=None):
         return cls.translation(
-            *[-i for i in origin], dimension=dimension
+            *origin, dimension=dimension
         ) * cls.scale(
             *scalars, dimension=dimension
-        ) * cls.translation(*origin, dimension=dimension)
+        ) * cls.translation(*[-i for i in origin], dimension=dimension)
 
     @staticmethod
-    def translation(*scalars, dimension=None)
+    def translation(*scalars, dimension=None):
         dimension = len(scalars) if dimension is None \
             else dimension
         scalars = (
             list(scalars) + [0] * dimension
         )[:dimension]
         transform = Matrix.identity(dimension + 1)
-        transform.set_column(-1, scalars)
+        transform.set_column(-1, scalars + [1])
         return transform
 
     @staticmethod
@@ -55,39 +59,413 @@ class Transform:
         transform.set_element(-sin_theta, orthogonal, basis)
         return transform
 
+    @staticmethod
+    def homogeneous(rotation, translation=None):
+        dimension = int(len(rotation)**0.5)
+        translation = [0] * dimension if translation is None \
+            else list(translation)
+        elements = []
+        for i in range(dimension):
+            elements.extend(rotation[i * dimension : (i + 1) * dimension])
+            elements.append(translation[i])
+        elements.extend([0] * dimension + [1])
+        return Matrix.new_tensor(dimension + 1, elements=elements)
+
+    @staticmethod
+    def planar_elements(theta, degrees=False):
+        theta = radians(theta) if degrees else theta
+        sin_theta, cos_theta = sin(theta), cos(theta)
+        return [cos_theta, -sin_theta, sin_theta, cos_theta]
+    @staticmethod
+    def axis_angle_elements(theta, axis, degrees=False):
+        theta = radians(theta) if degrees else theta
+        x, y, z = axis.elements if isinstance(axis, TensorType) else axis
+        magnitude = (x**2 + y**2 + z**2)**0.5
+        x, y, z = x / magnitude, y / magnitude, z / magnitude
+        sin_theta, cos_theta = sin(theta), cos(theta)
+        versine = 1 - cos_theta
+        return [
+            cos_theta + x * x * versine, 
+            x * y * versine - z * sin_theta, 
+            x * z * versine + y * sin_theta,
+            y * x * versine + z * sin_theta, 
+            cos_theta + y * y * versine, 
+            y * z * versine - x * sin_theta,
+            z * x * versine - y * sin_theta, 
+            z * y * versine + x * sin_theta, 
+            cos_theta + z * z * versine
+        ]
+    @staticmethod
+    def quaternion_elements(w, x, y, z):
+        magnitude = (w**2 + x**2 + y**2 + z**2)**0.5
+        w, x, y, z = w / magnitude, x / magnitude, y / magnitude, z / magnitude
+        return [
+            1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w),
+            2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w),
+            2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)
+        ]
+    @classmethod
+    def euler_elements(cls, angles, order="xyz", degrees=False):
+        elements = [1, 0, 0, 0, 1, 0, 0, 0, 1]
+        for theta, axis in zip(angles, order.lower()):
+            elements = cls.compose_elements(
+                cls.axis_angle_elements(
+                    theta, 
+                    [1 if axis == i else 0 for i in "xyz"], 
+                    degrees=degrees
+                ),
+                elements
+            )
+        return elements
+    @staticmethod
+    def compose_elements(rotation, other):
+        dimension = int(len(rotation)**0.5)
+        columns = [other[i::dimension] for i in range(dimension)]
+        return [
+            sum(
+                map(mul, rotation[i * dimension : (i + 1) * dimension], j)
+            )
+            for i in range(dimension) for j in columns
+        ]
+
+    @classmethod
+    def axis_angle(cls, theta, axis, degrees=False):
+        return cls.homogeneous(
+            cls.axis_angle_elements(theta, axis, degrees=degrees)
+        )
+    @classmethod
+    def quaternion(cls, w, x, y, z):
+        return cls.homogeneous(
+            cls.quaternion_elements(w, x, y, z)
+        )
+    @classmethod
+    def euler(cls, angles, order="xyz", degrees=False):
+        return cls.homogeneous(
+            cls.euler_elements(angles, order=order, degrees=degrees)
+        )
+
     @classmethod
     def rotation(cls, theta, axis, dimension=None, degrees=False):
         axis = axis if isinstance(axis, Vector) \
             else Vector(*axis, dimension=dimension) if isinstance(axis, Iterable) \
             else Vector.axis(axis, axis if dimension is None else dimension)
         dimension = axis.dimension
-        planar_combinations = combinations(
-            range(dimension), 2
+        if dimension == 2:
+            return cls.homogeneous(
+                cls.planar_elements(theta, degrees=degrees)
             )
+        elif dimension == 3:
+            return cls.axis_angle(theta, axis, degrees=degrees)
+        planar_combinations = list(
+            combinations(range(dimension), 2)
+        )
         planar_angles = [
-            axis.planar_angle(i, j) of i, j in planar_combination
+            axis.plane_angle(i, j) if axis[i] or axis[j] else 0
+            for i, j in planar_combinations
         ]
         transform = Matrix.identity(dimension + 1)
         for i, pair in enumerate(planar_combinations):
             cls.planar_rotation(
-                -planar_angle[i], *pair, dimension, degrees=False
-            )transform.(transform) if planar_angle[i] else None
+                -planar_angles[i], *pair, dimension, degrees=False
+            ).transform(transform) if planar_angles[i] else None
 
         cls.planar_rotation(
             theta, 0, 1, dimension, degrees=degrees
         ).transform(transform)
 
-        for i, pair in enumerate(planar_combinations):
-            angle = axis.planar_angle(i, j)
+        for i, pair in reversed(list(enumerate(planar_combinations))):
             cls.planar_rotation(
-                planar_angle[i], *pair, dimension, degrees=False
-            )transform.(transform)
+                planar_angles[i], *pair, dimension, degrees=False
+            ).transform(transform) if planar_angles[i] else None
         return transform
 
     @classmethod
-    def rotation_from(theta, axis, origin, dimension=None, degrees=False):
+    def rotation_from(cls, theta, axis, origin, dimension=None, degrees=False):
         return cls.translation(
-            *[-i for i in origin], dimension=dimension
+            *origin, dimension=dimension
         ) * cls.rotation(
             theta, axis, dimension=dimension, degrees=degrees
-        ) * cls.translation(*origin, dimension=dimension)
+        ) * cls.translation(*[-i for i in origin], dimension=dimension)
+
+    @staticmethod
+    def point_columns(points, dimension):
+        if isinstance(points, TensorType) and points.width != dimension \
+                and (points.width != 1 or points.height != dimension):
+            raise ValueError(
+                f"Points of width {points.width} do not match "
+                f"dimension {dimension}"
+            )
+        elements = points._elements if isinstance(points, Tensor) \
+                and points.width == dimension \
+            else array("d", points.elements) \
+                if isinstance(points, TensorType) and points.width == 1 \
+                and points.height == dimension \
+            else array("d", [j for i in points.row_buffers() for j in i]) \
+                if isinstance(points, TensorType) \
+            else array("d")
+        [
+            elements.extend(
+                i.elements if isinstance(i, TensorType) else i
+            ) for i in points
+        ] if not isinstance(points, TensorType) else None
+        return [elements[i::dimension] for i in range(dimension)]
+
+    @classmethod
+    def apply_many(cls, transform, points):
+        dimension = transform.dimension - 1
+        rows = transform.row_buffers()
+        columns = cls.point_columns(points, dimension)
+        size = len(columns[0]) if columns else 0
+
+        def combine(row):
+            output = [row[-1]] * size
+            for column, scalar in zip(columns, row):
+                output = list(
+                    map(add, output, map(mul, column, repeat(scalar)))
+                ) if scalar else output
+            return output
+        outputs = [combine(i) for i in rows[:-1]]
+        if any(rows[-1][:-1]) or rows[-1][-1] != 1:
+            weights = combine(rows[-1])
+            outputs = [list(map(truediv, i, weights)) for i in outputs]
+
+        elements = array("d", bytes(8 * dimension * size))
+        for i, output in enumerate(outputs):
+            elements[i::dimension] = array("d", output)
+        return Tensor(dimension, height=size, elements=elements, link=True)
+
+
+class RigidTransform:
+    @classmethod
+    def identity(cls, dimension=3):
+        return cls(
+            [1 if i % (dimension + 1) == 0 else 0 for i in range(dimension**2)]
+        )
+    @classmethod
+    def from_planar_angle(cls, theta, translation=None, degrees=False):
+        return cls(
+            Transform.planar_elements(theta, degrees=degrees), translation
+        )
+    @classmethod
+    def from_axis_angle(cls, theta, axis, translation=None, degrees=False):
+        return cls(
+            Transform.axis_angle_elements(theta, axis, degrees=degrees), 
+            translation
+        )
+    @classmethod
+    def from_quaternion(cls, w, x, y, z, translation=None):
+        return cls(Transform.quaternion_elements(w, x, y, z), translation)
+    @classmethod
+    def from_euler(cls, angles, order="xyz", translation=None, 
+                   degrees=False):
+        return cls(
+            Transform.euler_elements(angles, order=order, degrees=degrees),
+            translation
+        )
+    @classmethod
+    def from_matrix(cls, matrix):
+        rows = matrix.row_buffers()
+        return cls(
+            [j for i in rows[:-1] for j in i[:-1]], 
+            [i[-1] for i in rows[:-1]]
+        )
+
+    def __init__(self, rotation, translation=None):
+        self._rotation = tuple(rotation)
+        self._dimension = int(len(self._rotation)**0.5)
+        self._translation = tuple(
+            [0] * self._dimension if translation is None else translation
+        )
+
+    @property
+    def rotation(self): return self._rotation
+    @property
+    def translation(self): return self._translation
+    @property
+    def dimension(self): return self._dimension
+    @property
+    def inverse(self):
+        dimension = self._dimension
+        rotation = [
+            self._rotation[j * dimension + i] 
+            for i in range(dimension) for j in range(dimension)
+        ]
+        return self.__class__(
+            rotation,
+            [
+                -sum(
+                    map(
+                        mul, 
+                        rotation[i * dimension : (i + 1) * dimension], 
+                        self._translation
+                    )
+                )
+                for i in range(dimension)
+            ]
+        )
+    @property
+    def matrix(self): 
+        return Transform.homogeneous(self._rotation, self._translation)
+
+    def compose(self, other):
+        return self.__class__(
+            Transform.compose_elements(self._rotation, other._rotation),
+            map(add, self.rotate(other._translation), self._translation)
+        )
+    def rotate(self, point):
+        dimension = self._dimension
+        point = list(
+            point.elements if isinstance(point, TensorType) else point
+        )
+        return [
+            sum(
+                map(mul, self._rotation[i * dimension : (i + 1) * dimension], point)
+            )
+            for i in range(dimension)
+        ]
+    def apply(self, point):
+        return tuple(
+            map(add, self.rotate(point), self._translation)
+        )
+    def apply_many(self, points):
+        dimension = self._dimension
+        columns = Transform.point_columns(points, dimension)
+        size = len(columns[0]) if columns else 0
+        elements = array("d", bytes(8 * dimension * size))
+        for i in range(dimension):
+            output = [self._translation[i]] * size
+            for column, scalar in zip(
+                columns, self._rotation[i * dimension : (i + 1) * dimension]
+            ):
+                output = list(
+                    map(add, output, map(mul, column, repeat(scalar)))
+                ) if scalar else output
+            elements[i::dimension] = array("d", output)
+        return Tensor(dimension, height=size, elements=elements, link=True)
+
+    def __mul__(self, other): return self.compose(other)
+    def __invert__(self): return self.inverse
+
+
+class TransformChain:
+    def __init__(self, transforms=(), dimension=3):
+        self._dimension = dimension
+        self._transforms = []
+        self._matrices = []
+        self._versions = []
+        self._matrix = self._inverse = None
+        [
+            self.add_transform(i) if isinstance(i, (Matrix, str))
+            else self.add_transform(
+                i[0], *i[1], **(i[2] if len(i) > 2 else {})
+            )
+            for i in transforms
+        ]
+
+    @property
+    def transforms(self): 
+        return tuple(
+            (i, tuple(j), dict(k)) for i, j, k in self._transforms
+        )
+    @property
+    def size(self): return len(self._transforms)
+    @property
+    def stale(self):
+        return any(
+            isinstance(i[0], Matrix) and i[0].version != j
+            for i, j in zip(self._transforms, self._versions)
+        )
+    @property
+    def matrix(self):
+        if self._matrix is None or self.stale:
+            self._inverse = None
+            matrices = [self.step_matrix(i) for i in range(self.size)]
+            self._matrix = matrices[0].copy() if matrices \
+                else Matrix.identity(self._dimension + 1)
+            for i in matrices[1:]:
+                self._matrix = i * self._matrix
+        return self._matrix
+    @property
+    def inverse(self):
+        matrix = self.matrix
+        self._inverse = matrix.inverse if self._inverse is None \
+            else self._inverse
+        return self._inverse
+    @property
+    def dimension(self): return self.matrix.dimension - 1
+
+    def invalidate(self, index=None):
+        if index is not None:
+            self._matrices[index] = None
+        self._matrix = self._inverse = None
+        return self
+
+    def step_matrix(self, index):
+        transform, args, kwargs = self._transforms[index]
+        if self._matrices[index] is None or isinstance(transform, Matrix) \
+                and transform.version != self._versions[index]:
+            self._matrices[index] = transform if isinstance(transform, Matrix) \
+                else getattr(Transform, transform)(*args, **kwargs)
+            self._versions[index] = transform.version \
+                if isinstance(transform, Matrix) else None
+        return self._matrices[index]
+
+    def add_transform(self, transform, *args, index=None, **kwargs):
+        if not isinstance(transform, Matrix) \
+                and not callable(getattr(Transform, transform, None)):
+            raise ValueError(f"Unknown transform '{transform}'")
+        index = self.size if index is None else index
+        self._transforms.insert(index, [transform, list(args), kwargs])
+        self._matrices.insert(index, None)
+        self._versions.insert(index, None)
+        return self.invalidate()
+    def set_parameters(self, index, *args, **kwargs):
+        transform = self._transforms[index]
+        if isinstance(transform[0], Matrix):
+            transform[0] = args[0]
+        else:
+            transform[1] = list(args) if args else transform[1]
+            transform[2].update(kwargs)
+        return self.invalidate(index)
+    def set_parameter(self, index, parameter, value):
+        transform = self._transforms[index]
+        if isinstance(transform[0], Matrix):
+            raise TypeError(
+                "Matrix steps have no parameters, use set_parameters"
+            )
+        if isinstance(parameter, int):
+            transform[1][parameter] = value
+        else:
+            transform[2][parameter] = value
+        return self.invalidate(index)
+    def remove_transform(self, index):
+        self._transforms.pop(index)
+        self._matrices.pop(index)
+        self._versions.pop(index)
+        return self.invalidate()
+
+    def translate(self, *scalars, **kwargs):
+        return self.add_transform("translation", *scalars, **kwargs)
+    def scale(self, *scalars, **kwargs):
+        return self.add_transform("scale", *scalars, **kwargs)
+    def rotate(self, theta, axis, **kwargs):
+        return self.add_transform("rotation", theta, axis, **kwargs)
+    def planar_rotate(self, theta, basis, orthogonal, dimension, **kwargs):
+        return self.add_transform(
+            "planar_rotation", theta, basis, orthogonal, dimension, **kwargs
+        )
+
+    def apply(self, point):
+        point = list(
+            point.elements if isinstance(point, TensorType) else point
+        )
+        return Vector(
+            self.apply_many([point]).row(0)
+        )
+    def apply_many(self, points):
+        return Transform.apply_many(self.matrix, points)
+    def apply_inverse_many(self, points):
+        return Transform.apply_many(self.inverse, points)
+
+    def __len__(self): return self.size
+    def __iter__(self): return iter(self.transforms)
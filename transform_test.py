@@ -0,0 +1,98 @@
+from math import cos, pi, sin
+
+from pytest import raises
+
+from matrix import Matrix
+from tensor import Tensor
+from transform import RigidTransform, Transform, TransformChain
+from vector import Vector
+
+
+def close(values, expected, tolerance=1e-12):
+    values = list(values)
+    return len(values) == len(expected) and all(
+        abs(i - j) <= tolerance for i, j in zip(values, expected)
+    )
+
+
+def test_apply_many_point_sources():
+    transform = Transform.translation(1, 2)
+    tensor = Tensor(2, height=3, elements=[1, 2, 3, 4, 5, 6])
+    assert list(Transform.apply_many(transform, tensor).elements) \
+        == [2, 4, 4, 6, 6, 8]
+    assert list(
+        Transform.apply_many(
+            transform, tensor.sub_tensor_reference(0, 1, 2, 2)
+        ).elements
+    ) == [4, 6, 6, 8]
+    assert list(Transform.apply_many(transform, Vector(5, 6)).elements) \
+        == [6, 8]
+    assert list(
+        Transform.apply_many(transform, [Vector(5, 6), (1, 1)]).elements
+    ) == [6, 8, 2, 3]
+
+
+def test_empty_chain_identity():
+    chain = TransformChain(dimension=2)
+    assert chain.matrix == Matrix.identity(3)
+    assert chain.matrix is chain.matrix
+    assert chain.dimension == 2
+    assert chain.inverse == Matrix.identity(3)
+    assert list(chain.apply_many([(1, 2)]).elements) == [1, 2]
+
+
+def test_chain_matrix_steps():
+    step = Transform.translation(1, 2)
+    chain = TransformChain([step, ("scale", (2, 2))])
+    assert list(chain.apply_many([(0, 0)]).elements) == [2, 4]
+    step[2, 0] = 3
+    assert list(chain.apply_many([(0, 0)]).elements) == [6, 4]
+    assert round(chain.inverse[2, 0], 12) == -3
+    with raises(TypeError):
+        chain.set_parameter(0, 0, 5)
+    chain.set_parameter(1, 0, 1)
+    assert list(chain.apply_many([(0, 0)]).elements) == [3, 4]
+
+
+def test_apply_many_rejects_mismatched_widths():
+    transform = Transform.translation(1, 2)
+    with raises(ValueError):
+        Transform.apply_many(
+            transform, Tensor(3, height=2, elements=[1, 2, 1, 3, 4, 1])
+        )
+
+
+def test_rotation_constructors_agree():
+    expected = [0, -1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    for transform in (
+        Transform.axis_angle(90, (0, 0, 2), degrees=True), 
+        Transform.quaternion(cos(pi / 4), 0, 0, sin(pi / 4)), 
+        Transform.euler([0, 0, 90], degrees=True), 
+        Transform.rotation(pi / 2, 2, dimension=3)
+    ):
+        assert isinstance(transform, Matrix)
+        assert close(transform.elements, expected)
+    assert close(
+        Transform.planar_rotation(90, 0, 1, 2, degrees=True).elements, 
+        [0, -1, 0, 1, 0, 0, 0, 0, 1]
+    )
+
+
+def test_rigid_transform():
+    transform = RigidTransform.from_axis_angle(
+        1, (1, 2, 3), translation=(1, 2, 3)
+    )
+    identity = transform * ~transform
+    assert close(identity.rotation, RigidTransform.identity().rotation)
+    assert close(identity.translation, [0, 0, 0])
+    points = Tensor(3, height=2, elements=[1, 1, 1, 0, 0, 0])
+    assert close(
+        transform.apply_many(points).elements, 
+        [*transform.apply((1, 1, 1)), 1, 2, 3]
+    )
+    assert close(
+        Transform.apply_many(transform.matrix, Vector(1, 1, 1)).elements, 
+        transform.apply((1, 1, 1))
+    )
+    assert RigidTransform.from_matrix(transform.matrix).rotation \
+        == transform.rotation
@@ -1,6 +1,9 @@
+from array import array
+from bisect import bisect_left
 from collections.abc import Sized, Iterable
-from itertools import combinations
-from math import acos
+from itertools import combinations, repeat
+from math import acos, dist
+from operator import mul
 
 from tensor import Tensor, TensorType
 
@@ -34,17 +37,20 @@ class Vector(Tensor):
             else elements
         dimension = len(elements) if dimension is None else dimension
         super().__init__(
-            1, height=dimension, elements=elements, **kwargs
+            1, height=dimension, elements=elements, link=link, **kwargs
         )
     @property
     def dimension(self): return self.height
     @property
     def magnitude(self):
-        return sum(
-            (i**2 for i in self.elements)
-        )**0.5
+        return self.cached(
+            "magnitude", lambda: sum(
+                map(mul, self._elements, self._elements)
+            )**0.5
+        )
     @property
-    def unit(self): return self / self.magnitude
+    def unit(self): 
+        return self.cached("unit", lambda: self / self.magnitude)
     @property
     def axial(self): 
         return len(
@@ -64,7 +70,7 @@ class Vector(Tensor):
             )
         )
     @property
-    def transpose(self): return Tensor.from_rows(self.columns)
+    def transpose(self): return self.transpose_reference()
 
     def cosine(self, other):
         return self.dot(other) / (self.magnitude * other.magnitude)
@@ -74,14 +80,14 @@ class Vector(Tensor):
         )
     def axis_angle(self, axis):
         return self.angle(
-            self.axis(axis)
+            self.axis(axis, self.dimension)
         )
     def plane_angle(self, basis, orthogonal):
         plane_vector = self.empty(self.dimension)
         plane_vector[basis] = self[basis] 
         plane_vector[orthogonal] = self[orthogonal] 
         return plane_vector.angle(
-            self.axis(basis)
+            self.axis(basis, self.dimension)
         )
     
     def distance_vector(self, other):
@@ -96,7 +102,11 @@ class Vector(Tensor):
 
     def dot(self, other):
         return sum(
-            i * j for i, j in zip(self._elements, other._elements)
+            i * j for i, j in zip(
+                self._elements, 
+                other._elements if isinstance(other, Tensor) 
+                else other.elements
+            )
         )
     def triple_scalar(self, vector, other):
         return self.cross(vector).dot(other)
@@ -115,4 +125,163 @@ class Vector(Tensor):
             )
 
     def __getitem__(self, index): return self.get_index(index)
-    def __iter__(self): return self.elements
\ No newline at end of file
+    def __iter__(self): return self.elements
+
+
+class VectorArray(Tensor):
+    @classmethod
+    def from_vectors(cls, vectors, dimension=None, storage="array"):
+        elements = array("d")
+        [
+            elements.extend(
+                i._elements if isinstance(i, Tensor) else i
+            )
+            for i in vectors
+        ]
+        dimension = dimension if dimension is not None \
+            else vectors[0].dimension if isinstance(vectors[0], Vector) \
+            else len(vectors[0])
+        tensor = cls(
+            dimension, height=len(elements) // dimension, elements=elements, 
+            link=True
+        )
+        return tensor if storage == "array" else tensor.to_storage(storage)
+
+    @property
+    def dimension(self): return self.width
+    @property
+    def count(self): return self.height
+    @property
+    def vectors(self): 
+        return (Vector(i) for i in self.row_buffers())
+    @property
+    def norms(self):
+        return self.cached(
+            "norms", lambda: array(
+                "d", (sum(map(mul, i, i))**0.5 for i in self.row_buffers())
+            )
+        )
+    @property
+    def units(self):
+        elements = array("d")
+        [
+            elements.extend(j / norm for j in i) 
+            for i, norm in zip(self.row_buffers(), self.norms)
+        ]
+        return self.__class__(
+            self.width, height=self.height, elements=elements, link=True
+        )
+    @property
+    def centroid(self):
+        return Vector(
+            [sum(i) / self.height for i in self.column_buffers()]
+        )
+    @property
+    def spacings(self):
+        rows = self.row_buffers()
+        return array("d", map(dist, rows[:-1], rows[1:]))
+
+    def vector(self, index): return Vector(self.row(index))
+    def set_vector(self, index, vector):
+        return self.set_row(
+            index, vector._elements if isinstance(vector, Tensor) else vector
+        )
+
+    def other_rows(self, other):
+        return repeat(list(other._elements)) if isinstance(other, Vector) \
+            else other.row_buffers() if isinstance(other, TensorType) \
+            else other
+
+    def dots(self, other):
+        return array(
+            "d", (
+                sum(map(mul, i, j)) 
+                for i, j in zip(self.row_buffers(), self.other_rows(other))
+            )
+        )
+    def crosses(self, other):
+        rows = zip(self.row_buffers(), self.other_rows(other))
+        if self.dimension == 2:
+            return array("d", (i[0] * j[1] - i[1] * j[0] for i, j in rows))
+        elif self.dimension == 3:
+            elements = array("d")
+            [
+                elements.extend(
+                    (
+                        i[1] * j[2] - i[2] * j[1],
+                        i[2] * j[0] - i[0] * j[2],
+                        i[0] * j[1] - i[1] * j[0]
+                    )
+                )
+                for i, j in rows
+            ]
+            return self.__class__(
+                3, height=self.height, elements=elements, link=True
+            )
+        raise ValueError("Cross products require 2 or 3 dimensions")
+    def angles(self, other):
+        norms = repeat(other.magnitude) if isinstance(other, Vector) \
+            else other.norms if isinstance(other, VectorArray) \
+            else (sum(map(mul, i, i))**0.5 for i in other)
+        return array(
+            "d", (
+                acos(min(max(dot / (i * j), -1), 1)) 
+                for dot, i, j in zip(self.dots(other), self.norms, norms)
+            )
+        )
+    def distances(self, other):
+        return array(
+            "d", map(dist, self.row_buffers(), self.other_rows(other))
+        )
+    def pairwise_distances(self, other=None):
+        rows = self.row_buffers()
+        others = rows if other is None \
+            else [list(other._elements)] if isinstance(other, Vector) \
+            else list(self.other_rows(other))
+        return Tensor(
+            len(others), height=len(rows), 
+            elements=array("d", (dist(i, j) for i in rows for j in others)), 
+            link=True
+        )
+
+    def sweep_order(self, rows):
+        order = sorted(range(len(rows)), key=lambda i: rows[i][0])
+        return order, [rows[i][0] for i in order]
+    def nearest_neighbors(self, other=None):
+        rows = self.row_buffers()
+        queries = rows if other is None \
+            else [list(other._elements)] if isinstance(other, Vector) \
+            else list(self.other_rows(other))
+        order, keys = self.sweep_order(rows)
+        indices, distances = [], array("d")
+        for n, query in enumerate(queries):
+            best, nearest = float("inf"), -1
+            start = bisect_left(keys, query[0])
+            for step in (-1, 1):
+                i = start if step > 0 else start - 1
+                while 0 <= i < len(order) and abs(keys[i] - query[0]) < best:
+                    if other is not None or order[i] != n:
+                        distance = dist(rows[order[i]], query)
+                        best, nearest = (distance, order[i]) \
+                            if distance < best else (best, nearest)
+                    i += step
+            indices.append(nearest)
+            distances.append(best)
+        return indices, distances
+    def nearest(self, other=None): return self.nearest_neighbors(other)[0]
+    def nearest_distances(self, other=None): 
+        return self.nearest_neighbors(other)[1]
+    def close_pairs(self, distance):
+        rows = self.row_buffers()
+        order, keys = self.sweep_order(rows)
+        pairs = []
+        for i, m in enumerate(order):
+            j = i + 1
+            while j < len(order) and keys[j] - keys[i] <= distance:
+                pairs.append(
+                    (min(m, order[j]), max(m, order[j]))
+                ) if dist(rows[m], rows[order[j]]) <= distance else None
+                j += 1
+        return sorted(pairs)
+
+    def __iter__(self): return self.vectors
@@ -0,0 +1,39 @@
+from math import pi
+
+from vector import Vector, VectorArray
+
+
+def close(values, expected, tolerance=1e-12):
+    values = list(values)
+    return len(values) == len(expected) and all(
+        abs(i - j) <= tolerance for i, j in zip(values, expected)
+    )
+
+
+def test_array_queries_accept_vector_array_and_list():
+    vectors = VectorArray.from_vectors([(3, 4), (0, 2), (1, 0)])
+    for other in (
+        Vector(1, 0), 
+        VectorArray.from_vectors([(1, 0)] * 3), 
+        [[1, 0]] * 3
+    ):
+        assert close(vectors.distances(other), [20**0.5, 5**0.5, 0])
+        assert close(vectors.dots(other), [3, 0, 1])
+        assert close(
+            vectors.angles(other), [0.9272952180016122, pi / 2, 0]
+        )
+    for other in (
+        Vector(1, 0), VectorArray.from_vectors([(1, 0)]), [[1, 0]]
+    ):
+        distances = vectors.pairwise_distances(other)
+        assert distances.shape == [1, 3]
+        assert close(distances.elements, [20**0.5, 5**0.5, 0])
+        assert vectors.nearest(other) == [2]
+
+
+def test_pairwise_and_nearest_within_array():
+    vectors = VectorArray.from_vectors([(0, 0), (3, 4), (0, 1)])
+    distances = vectors.pairwise_distances()
+    assert distances.shape == [3, 3]
+    assert close(distances.elements, [0, 5, 1, 5, 0, 18**0.5, 1, 18**0.5, 0])
+    assert vectors.nearest() == [2, 2, 0]